@@ -41,6 +41,19 @@ GS8 = 6
 # Aliases for compatibility
 MVLSB = MONO_VLSB
 
+# Per-format layout: (bits per pixel, stride alignment, height alignment),
+# indexed by format constant. As in the C module, the stride is rounded up
+# so each row starts on a byte boundary, and MONO_VLSB needs whole 8-row pages.
+_FORMAT_INFO = (
+    (1, 1, 8),      # MONO_VLSB
+    (16, 1, 1),     # RGB565
+    (4, 2, 1),      # GS4_HMSB
+    (1, 8, 1),      # MONO_HLSB
+    (1, 8, 1),      # MONO_HMSB
+    (2, 4, 1),      # GS2_HMSB
+    (8, 1, 1),      # GS8
+)
+
 
 # ====================================================================
 # ASM_THUMB OPTIMIZED HELPERS
@@ -51,10 +64,11 @@ MVLSB = MONO_VLSB
 def _asm_fill_byte(r0, r1, r2):
     """
     Fill memory with a byte value using assembly (optimized with word writes)
+    memset-style: byte stores up to a word boundary, word stores, byte tail
     Args:
-        r0: buffer address
+        r0: buffer address (any alignment)
         r1: number of bytes to fill
-        r2: byte value to fill
+        r2: byte value to fill (0-255)
     """
     # Replicate byte across all 4 positions in a 32-bit word
     # r3 = r2 | (r2 << 8) | (r2 << 16) | (r2 << 24)
@@ -64,7 +78,32 @@ def _asm_fill_byte(r0, r1, r2):
     lsl(r4, r3, 16)     # r4 = (r3) << 16
     orr(r3, r4)         # r3 now has byte replicated 4 times
 
-    # Calculate number of words (r1 / 4)
+    # Byte stores until r0 is word aligned (unaligned str faults on M0+)
+    label(ALIGN_LOOP)
+    cmp(r1, 0)
+    beq(END)
+    mov(r4, 3)
+    and_(r4, r0)        # r4 = r0 & 3 (sets Z when aligned)
+    beq(ALIGNED)
+    strb(r2, [r0, 0])   # Store byte
+    add(r0, r0, 1)      # r0++
+    sub(r1, r1, 1)      # r1--
+    b(ALIGN_LOOP)
+    label(ALIGNED)
+
+    # Block loop: one stmia stores 4 words (16 bytes) per iteration
+    mov(r4, r3)
+    mov(r5, r3)
+    mov(r6, r3)
+    label(BLOCK_LOOP)
+    cmp(r1, 16)
+    bcc(WORD_SETUP)     # fewer than 16 bytes left
+    data(2, 0xC078)     # stmia r0!, {r3, r4, r5, r6}
+    sub(r1, 16)         # r1 -= 16
+    b(BLOCK_LOOP)
+    label(WORD_SETUP)
+
+    # Calculate number of remaining words (r1 / 4, at most 3)
     mov(r4, r1)         # r4 = total bytes
     lsr(r4, r4, 2)      # r4 = total bytes / 4 (number of words)
 
@@ -103,11 +142,29 @@ def _asm_fill_word(r0, r1, r2):
         r1: number of words to fill (total_bytes // 4)
         r2: 32-bit word value to fill
     """
-    label(LOOP)
-    str(r2, [r0, 0])   # Store word at r0
+    # Copies of the word for a 4-register store-multiple
+    mov(r3, r2)
+    mov(r4, r2)
+    mov(r5, r2)
+
+    # Block loop: one stmia stores 4 words (16 bytes) per iteration
+    label(BLOCK_LOOP)
+    cmp(r1, 4)
+    bcc(WORD_LOOP)      # fewer than 4 words left
+    data(2, 0xC03C)     # stmia r0!, {r2, r3, r4, r5}
+    sub(r1, 4)          # r1 -= 4
+    b(BLOCK_LOOP)
+
+    # Remaining 0-3 words
+    label(WORD_LOOP)
+    cmp(r1, 0)
+    beq(END)
+    str(r2, [r0, 0])    # Store word at r0
     add(r0, r0, 4)      # r0 += 4
     sub(r1, r1, 1)      # r1--
-    bne(LOOP)           # if r1 != 0 goto LOOP
+    b(WORD_LOOP)
+
+    label(END)
 
 
 @micropython.asm_thumb
@@ -115,23 +172,44 @@ def _asm_fill_rgb565(r0, r1, r2):
     """
     Fill RGB565 buffer with alternating low/high bytes (optimized with word writes)
     Args:
-        r0: buffer address
+        r0: buffer address (2-byte aligned)
         r1: number of pixels to fill
         r2: 16-bit RGB565 color value
 
-    Note: Uses r3, r4, r5 as scratch registers
+    Note: Uses r3-r7 as scratch registers
     """
     # Create 32-bit word containing 2 pixels (color | (color << 16))
     lsl(r3, r2, 16)     # r3 = color << 16
-    movw(r4, 0xFFFF)    # r4 = 0xFFFF (use movw for 16-bit immediate)
-    and_(r2, r4)        # r2 = color & 0xFFFF (lower 16 bits)
+    lsr(r2, r3, 16)     # r2 = color & 0xFFFF (Thumb-1 only, no movw needed)
     orr(r3, r2)         # r3 = (color << 16) | color (2 pixels in one word)
 
+    # One halfword store first if r0 is not word aligned
+    cmp(r1, 0)
+    beq(END)
+    mov(r4, 2)
+    and_(r4, r0)        # r4 = r0 & 2 (sets Z when aligned)
+    beq(ALIGNED)
+    strh(r2, [r0, 0])   # Store halfword (1 pixel)
+    add(r0, r0, 2)      # r0 += 2
+    sub(r1, r1, 1)      # r1--
+    label(ALIGNED)
+
     # Calculate number of word writes (pixels / 2)
     mov(r4, r1)         # r4 = total pixels
     lsr(r4, r4, 1)      # r4 = pixels / 2 (number of words)
 
-    # Word fill loop (write 2 pixels at once)
+    # Block loop: one stmia stores 4 words (8 pixels) per iteration
+    mov(r5, r3)
+    mov(r6, r3)
+    mov(r7, r3)
+    label(BLOCK_LOOP)
+    cmp(r4, 4)
+    bcc(WORD_LOOP)      # fewer than 4 words left
+    data(2, 0xC0E8)     # stmia r0!, {r3, r5, r6, r7}
+    sub(r4, 4)          # r4 -= 4
+    b(BLOCK_LOOP)
+
+    # Word fill loop for the remaining 0-3 words (2 pixels each)
     label(WORD_LOOP)
     cmp(r4, 0)
     beq(PIXEL_LOOP_SETUP)
@@ -154,15 +232,140 @@ def _asm_fill_rgb565(r0, r1, r2):
     label(END)
 
 
+@micropython.asm_thumb
+def _asm_fill_stride(r0, r1, r2, r3):
+    """
+    Store a byte value at a fixed stride (one byte per row of a column)
+    Args:
+        r0: address of first byte
+        r1: stride in bytes
+        r2: number of bytes to store (must be > 0)
+        r3: byte value to store
+    """
+    label(LOOP)
+    strb(r3, [r0, 0])   # Store byte
+    add(r0, r0, r1)     # r0 += stride
+    sub(r2, r2, 1)      # r2--
+    bgt(LOOP)           # if r2 > 0 goto LOOP
+
+
+@micropython.asm_thumb
+def _asm_vfill_rgb565(r0, r1, r2, r3):
+    """
+    Store an RGB565 halfword at a fixed stride (one pixel per row of a column)
+    Args:
+        r0: address of first pixel (must be halfword aligned)
+        r1: number of pixels to store (must be > 0)
+        r2: RGB565 color value (16-bit)
+        r3: stride in bytes
+    """
+    label(LOOP)
+    strh(r2, [r0, 0])   # Store halfword
+    add(r0, r0, r3)     # r0 += stride
+    sub(r1, r1, 1)      # r1--
+    bgt(LOOP)           # if r1 > 0 goto LOOP
+
+
+@micropython.asm_thumb
+def _asm_rmw_stride(r0, r1, r2, r3):
+    """
+    Masked read-modify-write of one byte per row at a fixed stride
+    Args:
+        r0: address of first byte
+        r1: stride in bytes
+        r2: number of bytes to update (must be > 0)
+        r3: (keep_mask << 8) | set_bits - byte = (byte & keep_mask) | set_bits
+    """
+    lsr(r4, r3, 8)      # r4 = keep mask
+    mov(r5, 0xFF)
+    and_(r3, r5)        # r3 = bits to set
+
+    label(LOOP)
+    ldrb(r5, [r0, 0])   # Load byte
+    and_(r5, r4)        # Clear the pixel's bits
+    orr(r5, r3)         # Insert the colour
+    strb(r5, [r0, 0])   # Store byte
+    add(r0, r0, r1)     # r0 += stride
+    sub(r2, r2, 1)      # r2--
+    bgt(LOOP)           # if r2 > 0 goto LOOP
+
+
+@micropython.asm_thumb
+def _asm_rmw_bytes(r0, r1, r2):
+    """
+    Masked read-modify-write of a contiguous byte run (word-wide when aligned)
+    Args:
+        r0: buffer address (any alignment)
+        r1: number of bytes to update
+        r2: (keep_mask << 8) | set_bits - byte = (byte & keep_mask) | set_bits
+    """
+    lsr(r3, r2, 8)      # r3 = keep mask
+    mov(r4, 0xFF)
+    and_(r2, r4)        # r2 = bits to set
+
+    # Replicate both masks across a 32-bit word
+    lsl(r4, r3, 8)
+    orr(r4, r3)
+    lsl(r5, r4, 16)
+    orr(r5, r4)         # r5 = keep mask x4
+    lsl(r4, r2, 8)
+    orr(r4, r2)
+    lsl(r6, r4, 16)
+    orr(r6, r4)         # r6 = set bits x4
+
+    # Byte updates until r0 is word aligned (unaligned ldr/str fault on M0+)
+    label(ALIGN_LOOP)
+    cmp(r1, 0)
+    beq(END)
+    mov(r4, 3)
+    and_(r4, r0)        # r4 = r0 & 3 (sets Z when aligned)
+    beq(WORD_LOOP)
+    ldrb(r4, [r0, 0])
+    and_(r4, r3)
+    orr(r4, r2)
+    strb(r4, [r0, 0])
+    add(r0, r0, 1)      # r0++
+    sub(r1, r1, 1)      # r1--
+    b(ALIGN_LOOP)
+
+    # Word loop - 4 bytes per load/modify/store
+    label(WORD_LOOP)
+    cmp(r1, 4)
+    bcc(BYTE_LOOP)      # fewer than 4 bytes left
+    ldr(r4, [r0, 0])
+    and_(r4, r5)
+    orr(r4, r6)
+    str(r4, [r0, 0])
+    add(r0, r0, 4)      # r0 += 4
+    sub(r1, r1, 4)      # r1 -= 4
+    b(WORD_LOOP)
+
+    # Remaining 0-3 bytes
+    label(BYTE_LOOP)
+    cmp(r1, 0)
+    beq(END)
+    ldrb(r4, [r0, 0])
+    and_(r4, r3)
+    orr(r4, r2)
+    strb(r4, [r0, 0])
+    add(r0, r0, 1)      # r0++
+    sub(r1, r1, 1)      # r1--
+    b(BYTE_LOOP)
+
+    label(END)
+
+
 
 class FrameBuffer:
     """
     Base FrameBuffer class with shared public API
 
-    Subclasses implement format-specific methods:
-    - _pixel_impl(x, y, c) -> int
-    - _hline_impl(x, y, w, c)
-    - _vline_impl(x, y, h, c)
+    Each format subclass overrides the public primitives directly with
+    its viper implementation, so calls need no per-format dispatch:
+    - pixel(x, y, c) -> int
+    - get_pixel(x, y) -> int, set_pixel(x, y, c)
+    - hline(x, y, w, c)
+    - vline(x, y, h, c)
     - _fill_rect_impl(x, y, w, h, c)
     """
 
@@ -174,12 +377,28 @@ class FrameBuffer:
             buffer: bytearray or buffer protocol object
             width: Width in pixels
             height: Height in pixels
-            stride: Optional stride in pixels (defaults to width)
+            stride: Optional stride in pixels (defaults to width, rounded
+                up to whole bytes per row as in C)
         """
+        if stride is None:
+            stride = width
+        # Round stride and check the buffer size from the format table,
+        # matching the C constructor
+        bpp, stride_align, height_align = _FORMAT_INFO[self.FORMAT]
+        stride = (stride + stride_align - 1) & ~(stride_align - 1)
+        height_required = (height + height_align - 1) & ~(height_align - 1)
+        if height_required * stride * bpp // 8 > len(buffer):
+            raise ValueError("buffer too small")
+
         self.buffer = buffer
         self.width = width
         self.height = height
-        self.stride = stride if stride is not None else width
+        self.stride = stride
+        # Raw buffer address, resolved once like the C module's buf pointer.
+        # Viper methods build their pointers from it instead of going
+        # through the buffer protocol on every call, so the buffer must
+        # not be resized or replaced after construction.
+        self._buf_addr = addressof(buffer)
 
     def pixel(self, x, y, c=-1):
         """
@@ -195,6 +414,14 @@ class FrameBuffer:
         """
         raise NotImplementedError("Subclass must implement pixel()")
 
+    def get_pixel(self, x, y):
+        """Return pixel value at (x, y), or 0 if out of bounds"""
+        raise NotImplementedError("Subclass must implement get_pixel()")
+
+    def set_pixel(self, x, y, c):
+        """Set pixel at (x, y) to color c (no -1 get sentinel)"""
+        raise NotImplementedError("Subclass must implement set_pixel()")
+
     def hline(self, x, y, w, c):
         """Draw horizontal line starting at (x, y) with width w and color c"""
         raise NotImplementedError("Subclass must implement hline()")
@@ -205,7 +432,10 @@ class FrameBuffer:
 
     def fill(self, c):
         """Fill entire framebuffer with color c"""
-        self.fill_rect(0, 0, self.width, self.height, c)
+        # Whole buffer is always in bounds - skip fill_rect's clipping and
+        # go straight to the format's full-buffer fast path
+        if self.width > 0 and self.height > 0:
+            self._fill_rect_impl(0, 0, self.width, self.height, c)
 
     def fill_rect(self, x, y, w, h, c):
         """
@@ -247,12 +477,86 @@ class FrameBuffer:
         """
         if f:
             self.fill_rect(x, y, w, h, c)
+        elif w < 1 or h < 1:
+            # Degenerate size - C still draws the edges that have extent,
+            # so keep its exact 4 calls
+            self.fill_rect(x, y, w, 1, c)
+            self.fill_rect(x, y + h - 1, w, 1, c)
+            self.fill_rect(x, y, 1, h, c)
+            self.fill_rect(x + w - 1, y, 1, h, c)
+        elif w <= 2 or h <= 2:
+            # Outline too thin to have an interior - same pixels as filled
+            self.fill_rect(x, y, w, h, c)
         else:
-            # Outline rectangle - draw 4 lines
-            self.fill_rect(x, y, w, 1, c)                  # Top edge
-            self.fill_rect(x, y + h - 1, w, 1, c)          # Bottom edge
-            self.fill_rect(x, y, 1, h, c)                  # Left edge
-            self.fill_rect(x + w - 1, y, 1, h, c)          # Right edge
+            # Outline rectangle - reject it once if entirely off-screen, then
+            # draw the 4 edges with the format's viper hline/vline, which clip
+            # themselves (no Python-level fill_rect clipping per edge)
+            if x >= self.width or y >= self.height or x + w <= 0 or y + h <= 0:
+                return
+            self.hline(x, y, w, c)                  # Top edge
+            self.hline(x, y + h - 1, w, c)          # Bottom edge
+            self.vline(x, y + 1, h - 2, c)          # Left edge
+            self.vline(x + w - 1, y + 1, h - 2, c)  # Right edge
+
+    @micropython.viper
+    def hlines(self, lines, c: int):
+        """
+        Draw many horizontal lines of one color in a single call
+
+        Saves the interpreted loop only - each line is still a call to hline.
+
+        Args:
+            lines: array.array('h') of packed (x, y, w) triples
+            c: Color value
+        """
+        p = ptr16(lines)
+        n = int(len(lines)) // 3 * 3
+        i = 0
+        while i < n:
+            # ptr16 reads are unsigned - sign-extend so off-screen x/y clip
+            x = ((p[i] ^ 0x8000) - 0x8000)
+            y = ((p[i + 1] ^ 0x8000) - 0x8000)
+            w = ((p[i + 2] ^ 0x8000) - 0x8000)
+            self.hline(x, y, w, c)
+            i += 3
+
+    @micropython.viper
+    def fill_rects(self, rects, c: int):
+        """
+        Fill many rectangles of one color in a single call
+
+        Saves the interpreted loop and fill_rect's Python clipping - each
+        rectangle is still a call to _fill_rect_impl.
+
+        Args:
+            rects: array.array('h') of packed (x, y, w, h) quads
+            c: Color value
+        """
+        width = int(self.width)
+        height = int(self.height)
+        p = ptr16(rects)
+        n = int(len(rects)) // 4 * 4
+        i = 0
+        while i < n:
+            x = ((p[i] ^ 0x8000) - 0x8000)
+            y = ((p[i + 1] ^ 0x8000) - 0x8000)
+            w = ((p[i + 2] ^ 0x8000) - 0x8000)
+            h = ((p[i + 3] ^ 0x8000) - 0x8000)
+            i += 4
+            # Same clipping as fill_rect, done natively per rect
+            if h < 1 or w < 1 or x + w <= 0 or y + h <= 0 or y >= height or x >= width:
+                continue
+            xend = x + w
+            if xend > width:
+                xend = width
+            yend = y + h
+            if yend > height:
+                yend = height
+            if x < 0:
+                x = 0
+            if y < 0:
+                y = 0
+            self._fill_rect_impl(x, y, xend - x, yend - y, c)
 
 
 
@@ -265,36 +569,65 @@ class FrameBufferMONO_VLSB(FrameBuffer):
         """Pixel implementation for MONO_VLSB format - optimized"""
         width = int(self.width)
         height = int(self.height)
-        stride = int(self.stride)
 
         # Bounds check - unsigned comparison handles negative values
         if uint(x) >= uint(width) or uint(y) >= uint(height):
             return 0
 
-        buf = ptr8(self.buffer)
+        stride = int(self.stride)
+        buf = ptr8(int(self._buf_addr))
         index = uint((y >> 3) * stride + x)
         offset = uint(y & 0x07)
         mask = uint(1 << offset)
 
         if c == -1:  # Get pixel
             return int((buf[index] >> offset) & 1)
-        else:  # Set pixel
-            if c:
-                buf[index] |= mask
-            else:
-                buf[index] &= uint(~mask & 0xFF)
+        else:  # Set pixel - branchless clear-then-or, as in the C code
+            buf[index] = uint((buf[index] & ~mask) | (uint(c != 0) << offset))
             return 0
 
 
+    @micropython.viper
+    def get_pixel(self, x: int, y: int) -> int:
+        """Get pixel for MONO_VLSB format"""
+        width = int(self.width)
+        height = int(self.height)
+
+        # Bounds check - unsigned comparison handles negative values
+        if uint(x) >= uint(width) or uint(y) >= uint(height):
+            return 0
+
+        stride = int(self.stride)
+        buf = ptr8(int(self._buf_addr))
+        index = uint((y >> 3) * stride + x)
+        return int((buf[index] >> (y & 0x07)) & 1)
+
+
+    @micropython.viper
+    def set_pixel(self, x: int, y: int, c: int):
+        """Set pixel for MONO_VLSB format"""
+        width = int(self.width)
+        height = int(self.height)
+
+        # Bounds check - unsigned comparison handles negative values
+        if uint(x) >= uint(width) or uint(y) >= uint(height):
+            return
+
+        stride = int(self.stride)
+        buf = ptr8(int(self._buf_addr))
+        index = uint((y >> 3) * stride + x)
+        offset = uint(y & 0x07)
+        buf[index] = uint((buf[index] & ~(1 << offset)) | (uint(c != 0) << offset))
+
+
     @micropython.viper
     def hline(self, x: int, y: int, w: int, c: int):
         """Horizontal line for MONO_VLSB format"""
         width = int(self.width)
         height = int(self.height)
-        stride = int(self.stride)
 
-        # Bounds check and clip
-        if y < 0 or y >= height or x >= width:
+        # Bounds check (unsigned compare also rejects negatives) and clip
+        if uint(y) >= uint(height) or x >= width:
             return
 
         if x < 0:
@@ -307,21 +640,22 @@ class FrameBufferMONO_VLSB(FrameBuffer):
         if w <= 0:
             return
 
-        buf = ptr8(self.buffer)
+        stride = int(self.stride)
+        buf = ptr8(int(self._buf_addr))
         byte_row = uint(y >> 3)
         bit_offset = uint(y & 7)
         mask = uint(1 << bit_offset)
         offset = uint(byte_row * stride + x)
 
-        if c:
-            # Set bits
-            for i in range(w):
-                buf[offset + i] |= mask
+        # Same masked update for set and clear: (byte & keep) | set_bits
+        keep = uint(~mask & 0xFF)
+        set_bits = mask if c else uint(0)
+        if w >= 16:
+            # Long run - word-wide read-modify-write in asm
+            _asm_rmw_bytes(int(self._buf_addr) + int(offset), w, int((keep << 8) | set_bits))
         else:
-            # Clear bits
-            inv_mask = uint(~mask & 0xFF)
             for i in range(w):
-                buf[offset + i] &= inv_mask
+                buf[offset + i] = uint((buf[offset + i] & keep) | set_bits)
 
 
     @micropython.viper
@@ -329,10 +663,9 @@ class FrameBufferMONO_VLSB(FrameBuffer):
         """Vertical line for MONO_VLSB format"""
         width = int(self.width)
         height = int(self.height)
-        stride = int(self.stride)
 
-        # Bounds check and clip
-        if x < 0 or x >= width or y >= height:
+        # Bounds check (unsigned compare also rejects negatives) and clip
+        if uint(x) >= uint(width) or y >= height:
             return
 
         if y < 0:
@@ -345,19 +678,39 @@ class FrameBufferMONO_VLSB(FrameBuffer):
         if h <= 0:
             return
 
-        buf = ptr8(self.buffer)
+        stride = int(self.stride)
+        buf = ptr8(int(self._buf_addr))
+        y_end = y + h - 1
+        first = y >> 3
+        last = y_end >> 3
+
+        # Bit masks for the first and last byte (page) the line touches
+        head_mask = uint((0xFF << (y & 7)) & 0xFF)
+        tail_mask = uint((2 << (y_end & 7)) - 1)
+
+        fill_byte = uint(0xFF if c else 0x00)
+        offset = first * stride + x
+
+        if first == last:
+            # Whole line within one byte - a single read-modify-write
+            mask = uint(head_mask & tail_mask)
+            buf[offset] = uint((buf[offset] & ~mask) | (fill_byte & mask))
+            return
 
-        # Set each pixel in the vertical line
-        for i in range(h):
-            y_pos = y + i
-            byte_offset = uint((y_pos >> 3) * stride + x)
-            bit_offset = uint(y_pos & 7)
-            mask = uint(1 << bit_offset)
+        end_offset = last * stride + x
 
-            if c:
-                buf[byte_offset] |= mask
-            else:
-                buf[byte_offset] &= uint(~mask & 0xFF)
+        # Writes go in increasing address order: head byte (RMW), full
+        # bytes (plain stores, no read needed), tail byte (RMW)
+        buf[offset] = uint((buf[offset] & ~head_mask) | (fill_byte & head_mask))
+        offset += stride
+        n_full = last - first - 1
+        if n_full >= 4:
+            _asm_fill_stride(int(self._buf_addr) + offset, stride, n_full, int(fill_byte))
+        else:
+            while offset < end_offset:
+                buf[offset] = fill_byte
+                offset += stride
+        buf[end_offset] = uint((buf[end_offset] & ~tail_mask) | (fill_byte & tail_mask))
 
 
     @micropython.viper
@@ -367,28 +720,55 @@ class FrameBufferMONO_VLSB(FrameBuffer):
         height = int(self.height)
         stride = int(self.stride)
 
-        # Check if this is a full-buffer fill - use optimized path
-        if x == 0 and y == 0 and w == width and h == height:
-            buf = ptr8(self.buffer)
-            buf_len = int(len(self.buffer))
-            fill_byte = uint(0xFF if c else 0x00)
-
-            # Fill entire buffer
-            for i in range(buf_len):
-                buf[i] = fill_byte
+        # Full-buffer fill - only when there are no padding columns
+        # (width == stride), which C leaves untouched
+        if x == 0 and y == 0 and w == width and h == height and width == stride:
+            buf_addr = int(self._buf_addr)
+            fill_byte = 0xFF if c else 0x00
+            full_pages = height >> 3
 
-            # Handle partial bits in last byte row if height not multiple of 8
+            # Whole pages are contiguous - fill them all with word stores
+            if full_pages:
+                _asm_fill_byte(buf_addr, full_pages * stride, fill_byte)
             remaining_bits = height & 7
-            if remaining_bits and c:
-                num_byte_rows = (height + 7) >> 3
+            if remaining_bits:
+                # Last page only partly used - masked RMW so the bits below
+                # the last row keep their value, as in C
                 mask = uint((1 << remaining_bits) - 1)
-                offset_base = uint((num_byte_rows - 1) * stride)
-                for col in range(width):
-                    buf[offset_base + col] &= mask
+                keep = uint(~mask & 0xFF)
+                setv = uint(fill_byte & mask)
+                _asm_rmw_bytes(buf_addr + full_pages * stride, stride, int((keep << 8) | setv))
         else:
-            # Partial rectangle - use hline for each row (matches C implementation)
-            for yy in range(h):
-                self._hline_mono_vlsb(x, y + yy, w, c)
+            # Partial rectangle (already clipped) - work page by page. Each
+            # byte is touched once per 8-row page instead of once per row,
+            # and fully covered pages are plain contiguous stores.
+            buf = ptr8(int(self._buf_addr))
+            fill_byte = 0xFF if c else 0x00
+            y_end = y + h - 1
+            first = y >> 3
+            last = y_end >> 3
+            offset = first * stride + x
+            for page in range(first, last + 1):
+                mask = uint(0xFF)
+                if page == first:
+                    mask &= uint((0xFF << (y & 7)) & 0xFF)
+                if page == last:
+                    mask &= uint((2 << (y_end & 7)) - 1)
+                if mask == 0xFF:
+                    if w >= 8:
+                        _asm_fill_byte(int(self._buf_addr) + offset, w, fill_byte)
+                    else:
+                        for i in range(w):
+                            buf[offset + i] = fill_byte
+                else:
+                    keep = uint(~mask & 0xFF)
+                    setv = uint(fill_byte & mask)
+                    if w >= 16:
+                        _asm_rmw_bytes(int(self._buf_addr) + offset, w, int((keep << 8) | setv))
+                    else:
+                        for i in range(w):
+                            buf[offset + i] = uint((buf[offset + i] & keep) | setv)
+                offset += stride
 
 
 
@@ -401,14 +781,14 @@ class FrameBufferRGB565(FrameBuffer):
         """Pixel implementation for RGB565 format - optimized with ptr16"""
         width = int(self.width)
         height = int(self.height)
-        stride = int(self.stride)
 
         # Bounds check - unsigned comparison handles negative values
         if uint(x) >= uint(width) or uint(y) >= uint(height):
             return 0
 
+        stride = int(self.stride)
         # Use ptr16 for direct 16-bit access (more efficient than byte manipulation)
-        buf = ptr16(self.buffer)
+        buf = ptr16(int(self._buf_addr))
         index = uint(y * stride + x)
 
         if c == -1:  # Get pixel
@@ -419,14 +799,43 @@ class FrameBufferRGB565(FrameBuffer):
 
 
     @micropython.viper
-    def hline(self, x: int, y: int, w: int, c: int):
-        """Horizontal line for RGB565 format"""
+    def get_pixel(self, x: int, y: int) -> int:
+        """Get pixel for RGB565 format"""
         width = int(self.width)
         height = int(self.height)
+
+        # Bounds check - unsigned comparison handles negative values
+        if uint(x) >= uint(width) or uint(y) >= uint(height):
+            return 0
+
         stride = int(self.stride)
+        buf = ptr16(int(self._buf_addr))
+        return int(buf[y * stride + x])
+
 
-        # Bounds check and clip
-        if y < 0 or y >= height or x >= width:
+    @micropython.viper
+    def set_pixel(self, x: int, y: int, c: int):
+        """Set pixel for RGB565 format"""
+        width = int(self.width)
+        height = int(self.height)
+
+        # Bounds check - unsigned comparison handles negative values
+        if uint(x) >= uint(width) or uint(y) >= uint(height):
+            return
+
+        stride = int(self.stride)
+        buf = ptr16(int(self._buf_addr))
+        buf[y * stride + x] = uint(c & 0xFFFF)
+
+
+    @micropython.viper
+    def hline(self, x: int, y: int, w: int, c: int):
+        """Horizontal line for RGB565 format - optimized with ptr16"""
+        width = int(self.width)
+        height = int(self.height)
+
+        # Bounds check (unsigned compare also rejects negatives) and clip
+        if uint(y) >= uint(height) or x >= width:
             return
 
         if x < 0:
@@ -439,27 +848,45 @@ class FrameBufferRGB565(FrameBuffer):
         if w <= 0:
             return
 
-        buf = ptr8(self.buffer)
-        offset = uint((y * stride + x) * 2)
-        c_low = uint(c & 0xFF)
-        c_high = uint((c >> 8) & 0xFF)
+        stride = int(self.stride)
+        buf_addr = int(self._buf_addr)
+        offset = y * stride + x
+        addr = buf_addr + (offset << 1)
+
+        if w >= 32:
+            # Long run (e.g. a full-width row) - word fill in asm, two
+            # pixels per store
+            _asm_fill_rgb565(addr, w, c)
+            return
 
-        # Write 2 bytes per pixel
-        for i in range(w):
-            idx = offset + (i * 2)
-            buf[idx] = c_low
-            buf[idx + 1] = c_high
+        # Short run - two pixels per 32-bit store from viper, which is
+        # cheaper than the asm call at this length. A leading halfword
+        # aligns the run (unaligned str faults on M0+), a trailing one
+        # covers an odd pixel.
+        buf = ptr16(buf_addr)
+        c_val = uint(c & 0xFFFF)
+        if addr & 2:
+            buf[offset] = c_val
+            offset += 1
+            addr += 2
+            w -= 1
+        buf32 = ptr32(addr)
+        c2 = uint(c_val | (c_val << 16))
+        n2 = w >> 1
+        for i in range(n2):
+            buf32[i] = c2
+        if w & 1:
+            buf[offset + (n2 << 1)] = c_val
 
 
     @micropython.viper
     def vline(self, x: int, y: int, h: int, c: int):
-        """Vertical line for RGB565 format"""
+        """Vertical line for RGB565 format - optimized with ptr16"""
         width = int(self.width)
         height = int(self.height)
-        stride = int(self.stride)
 
-        # Bounds check and clip
-        if x < 0 or x >= width or y >= height:
+        # Bounds check (unsigned compare also rejects negatives) and clip
+        if uint(x) >= uint(width) or y >= height:
             return
 
         if y < 0:
@@ -472,16 +899,19 @@ class FrameBufferRGB565(FrameBuffer):
         if h <= 0:
             return
 
-        buf = ptr8(self.buffer)
-        c_low = uint(c & 0xFF)
-        c_high = uint((c >> 8) & 0xFF)
-        row_bytes = uint(stride * 2)
+        stride = int(self.stride)
+        buf = ptr16(int(self._buf_addr))
+        c_val = uint(c & 0xFFFF)
 
-        # Write 2 bytes per pixel, advance by row stride
+        # Write 1 halfword per pixel, advance by row stride (no multiply per row)
+        offset = uint(y * stride + x)
+        if h >= 16:
+            # Tall line - strided halfword store kernel in asm
+            _asm_vfill_rgb565(int(self._buf_addr) + int(offset << 1), h, int(c_val), stride << 1)
+            return
         for i in range(h):
-            offset = uint(((y + i) * stride + x) * 2)
-            buf[offset] = c_low
-            buf[offset + 1] = c_high
+            buf[offset] = c_val
+            offset += stride
 
 
     @micropython.viper
@@ -491,19 +921,48 @@ class FrameBufferRGB565(FrameBuffer):
         height = int(self.height)
         stride = int(self.stride)
 
-        # Check if this is a full-buffer fill - use optimized asm path
-        if x == 0 and y == 0 and w == width and h == height:
+        # Full-buffer fill - only when there are no padding pixels
+        # (width == stride), which C leaves untouched
+        if x == 0 and y == 0 and w == width and h == height and width == stride:
             total_pixels = height * stride
-            buf_addr = int(addressof(self.buffer))
+            buf_addr = int(self._buf_addr)
             _asm_fill_rgb565(buf_addr, total_pixels, c)
+        elif x == 0 and w == stride:
+            # Full-width band - rows are contiguous, one word fill for all of them
+            _asm_fill_rgb565(int(self._buf_addr) + ((y * stride) << 1), h * stride, c)
         else:
             # Partial fill - use row-by-row approach like C
-            buf = ptr16(self.buffer)
+            if w >= 32:
+                # Wide rows - word fill in asm, two pixels per store
+                row_addr = int(self._buf_addr) + ((y * stride + x) << 1)
+                row_bytes = stride << 1
+                for yy in range(h):
+                    _asm_fill_rgb565(row_addr, w, c)
+                    row_addr += row_bytes
+                return
+            # Narrow rows - two pixels per 32-bit store from viper, with a
+            # halfword before (to word-align) and after (odd pixel) as needed
+            buf_addr = int(self._buf_addr)
+            buf = ptr16(buf_addr)
             c_val = uint(c & 0xFFFF)
+            c2 = uint(c_val | (c_val << 16))
+            row_offset = y * stride + x
             for yy in range(h):
-                offset = uint((y + yy) * stride + x)
-                for xx in range(w):
-                    buf[offset + xx] = c_val
+                offset = row_offset
+                row_offset += stride
+                addr = buf_addr + (offset << 1)
+                n = w
+                if addr & 2:
+                    buf[offset] = c_val
+                    offset += 1
+                    addr += 2
+                    n -= 1
+                buf32 = ptr32(addr)
+                n2 = n >> 1
+                for xx in range(n2):
+                    buf32[xx] = c2
+                if n & 1:
+                    buf[offset + (n2 << 1)] = c_val
 
 
 
@@ -516,13 +975,13 @@ class FrameBufferGS4_HMSB(FrameBuffer):
         """Pixel implementation for GS4_HMSB format"""
         width = int(self.width)
         height = int(self.height)
-        stride = int(self.stride)
 
-        # Bounds check
-        if x < 0 or x >= width or y < 0 or y >= height:
+        # Bounds check - unsigned comparison handles negative values
+        if uint(x) >= uint(width) or uint(y) >= uint(height):
             return 0
 
-        buf = ptr8(self.buffer)
+        stride = int(self.stride)
+        buf = ptr8(int(self._buf_addr))
         index = uint((y * stride + x) >> 1)
 
         if c == -1:  # Get pixel
@@ -538,15 +997,49 @@ class FrameBufferGS4_HMSB(FrameBuffer):
             return 0
 
 
+    @micropython.viper
+    def get_pixel(self, x: int, y: int) -> int:
+        """Get pixel for GS4_HMSB format"""
+        width = int(self.width)
+        height = int(self.height)
+
+        # Bounds check - unsigned comparison handles negative values
+        if uint(x) >= uint(width) or uint(y) >= uint(height):
+            return 0
+
+        stride = int(self.stride)
+        buf = ptr8(int(self._buf_addr))
+        # Odd x is the lower nibble, even x the upper one
+        shift = uint((~x & 1) << 2)
+        return int((buf[(y * stride + x) >> 1] >> shift) & 0x0F)
+
+
+    @micropython.viper
+    def set_pixel(self, x: int, y: int, c: int):
+        """Set pixel for GS4_HMSB format"""
+        width = int(self.width)
+        height = int(self.height)
+
+        # Bounds check - unsigned comparison handles negative values
+        if uint(x) >= uint(width) or uint(y) >= uint(height):
+            return
+
+        stride = int(self.stride)
+        buf = ptr8(int(self._buf_addr))
+        index = uint((y * stride + x) >> 1)
+        # Odd x is the lower nibble, even x the upper one
+        shift = uint((~x & 1) << 2)
+        buf[index] = uint((buf[index] & ~(0x0F << shift)) | ((c & 0x0F) << shift))
+
+
     @micropython.viper
     def hline(self, x: int, y: int, w: int, c: int):
         """Horizontal line for GS4_HMSB format"""
         width = int(self.width)
         height = int(self.height)
-        stride = int(self.stride)
 
-        # Bounds check and clip
-        if y < 0 or y >= height or x >= width:
+        # Bounds check (unsigned compare also rejects negatives) and clip
+        if uint(y) >= uint(height) or x >= width:
             return
 
         if x < 0:
@@ -559,7 +1052,8 @@ class FrameBufferGS4_HMSB(FrameBuffer):
         if w <= 0:
             return
 
-        buf = ptr8(self.buffer)
+        stride = int(self.stride)
+        buf = ptr8(int(self._buf_addr))
         row_offset = uint((y * stride) >> 1)
         c_nibble = uint(c & 0x0F)
 
@@ -572,12 +1066,16 @@ class FrameBufferGS4_HMSB(FrameBuffer):
             buf[row_offset + idx] = uint((buf[row_offset + idx] & 0xF0) | c_nibble)
             i += 1
 
-        # Phase 2: Handle pixel pairs (write full bytes)
-        c_byte = uint((c_nibble << 4) | c_nibble)
-        while i + 1 < w:
-            idx = uint((x + i) >> 1)
-            buf[row_offset + idx] = c_byte
-            i += 2
+        # Phase 2: Handle pixel pairs (write full bytes) - word stores for long runs
+        c_byte = uint(c_nibble * 0x11)  # Colour replicated into both nibbles
+        n_bytes = (w - i) >> 1
+        start = row_offset + uint((x + i) >> 1)
+        if n_bytes >= 8:
+            _asm_fill_byte(int(self._buf_addr) + int(start), n_bytes, int(c_byte))
+        else:
+            for k in range(n_bytes):
+                buf[start + k] = c_byte
+        i += n_bytes << 1
 
         # Phase 3: Handle last pixel if remaining
         if i < w:
@@ -590,10 +1088,9 @@ class FrameBufferGS4_HMSB(FrameBuffer):
         """Vertical line for GS4_HMSB format"""
         width = int(self.width)
         height = int(self.height)
-        stride = int(self.stride)
 
-        # Bounds check and clip
-        if x < 0 or x >= width or y >= height:
+        # Bounds check (unsigned compare also rejects negatives) and clip
+        if uint(x) >= uint(width) or y >= height:
             return
 
         if y < 0:
@@ -606,38 +1103,85 @@ class FrameBufferGS4_HMSB(FrameBuffer):
         if h <= 0:
             return
 
-        buf = ptr8(self.buffer)
+        stride = int(self.stride)
+        buf = ptr8(int(self._buf_addr))
         c_nibble = uint(c & 0x0F)
-        is_odd = x & 1
 
+        # Nibble mask and value only depend on x - compute once
+        if x & 1:  # Odd x, lower nibble
+            keep = uint(0xF0)
+            setv = c_nibble
+        else:  # Even x, upper nibble
+            keep = uint(0x0F)
+            setv = uint(c_nibble << 4)
+
+        # Advance by one row of bytes instead of multiplying per pixel
+        bytes_per_row = stride >> 1
+        offset = y * bytes_per_row + (x >> 1)
+        if h >= 8:
+            # Tall line - strided read-modify-write in asm
+            _asm_rmw_stride(int(self._buf_addr) + offset, bytes_per_row, h, int((keep << 8) | setv))
+            return
         for i in range(h):
-            row_offset = uint(((y + i) * stride) >> 1)
-            idx = uint(x >> 1)
-
-            if is_odd:  # Odd x, lower nibble
-                buf[row_offset + idx] = uint((buf[row_offset + idx] & 0xF0) | c_nibble)
-            else:  # Even x, upper nibble
-                buf[row_offset + idx] = uint((buf[row_offset + idx] & 0x0F) | (c_nibble << 4))
+            buf[offset] = uint((buf[offset] & keep) | setv)
+            offset += bytes_per_row
 
 
     @micropython.viper
     def _fill_rect_impl(self, x: int, y: int, w: int, h: int, c: int):
         """Fill rectangle for GS4_HMSB format"""
-        # Check if full-buffer fill for optimization
-        if x == 0 and y == 0 and w == int(self.width) and h == int(self.height):
-            buf = ptr8(self.buffer)
-            height = int(self.height)
-            stride = int(self.stride)
-            c_nibble = uint(c & 0x0F)
-            c_byte = uint((c_nibble << 4) | c_nibble)
-            bytes_per_row = int((stride + 1) >> 1)
-            total_bytes = height * bytes_per_row
-            for i in range(total_bytes):
-                buf[i] = c_byte
+        width = int(self.width)
+        height = int(self.height)
+
+        c_byte = (c & 0x0F) * 0x11  # Colour replicated into both nibbles
+        bytes_per_row = int(self.stride) >> 1
+
+        # Check if full-buffer fill for optimization - only without padding
+        # pixels (width == stride), which C leaves untouched
+        if x == 0 and y == 0 and w == width and h == height and width == int(self.stride):
+            # Rows are contiguous - one flat word fill over the whole buffer
+            _asm_fill_byte(int(self._buf_addr), height * bytes_per_row, c_byte)
+        elif w < h:
+            # Tall, narrow rectangle (e.g. the sides drawn by rect()) - go by
+            # columns. A column pair starting at even x shares each byte, so it
+            # is one plain byte store per row instead of two nibble RMWs.
+            vline = self.vline
+            if x & 1:
+                vline(x, y, h, c)
+                x += 1
+                w -= 1
+            buf_addr = int(self._buf_addr)
+            while w >= 2:
+                _asm_fill_stride(buf_addr + y * bytes_per_row + (x >> 1), bytes_per_row, h, c_byte)
+                x += 2
+                w -= 2
+            if w:
+                vline(x, y, h, c)
         else:
-            # Partial rectangle - use hline for each row
+            # Partial rectangle (already clipped) - the odd-nibble edges and
+            # paired middle run are the same for every row, so work them out
+            # once and only advance the row address
+            buf_addr = int(self._buf_addr)
+            buf = ptr8(buf_addr)
+            c_nibble = c & 0x0F
+            head = x & 1  # Odd start - lower nibble of first byte
+            n_bytes = (w - head) >> 1
+            tail = (w - head) & 1  # Odd end - upper nibble of last byte
+            row_start = y * bytes_per_row + (x >> 1)
             for yy in range(h):
-                self._hline_gs4_hmsb(x, y + yy, w, c)
+                offset = row_start
+                if head:
+                    buf[offset] = (buf[offset] & 0xF0) | c_nibble
+                    offset += 1
+                if n_bytes >= 8:
+                    _asm_fill_byte(buf_addr + offset, n_bytes, c_byte)
+                else:
+                    for k in range(n_bytes):
+                        buf[offset + k] = c_byte
+                offset += n_bytes
+                if tail:
+                    buf[offset] = (buf[offset] & 0x0F) | (c_nibble << 4)
+                row_start += bytes_per_row
 
 
 
@@ -650,36 +1194,65 @@ class FrameBufferMONO_HLSB(FrameBuffer):
         """Pixel implementation for MONO_HLSB format"""
         width = int(self.width)
         height = int(self.height)
-        stride = int(self.stride)
 
-        # Bounds check
-        if x < 0 or x >= width or y < 0 or y >= height:
+        # Bounds check - unsigned comparison handles negative values
+        if uint(x) >= uint(width) or uint(y) >= uint(height):
             return 0
 
-        buf = ptr8(self.buffer)
-        bytes_per_row = uint((stride + 7) >> 3)
+        stride = int(self.stride)
+        buf = ptr8(int(self._buf_addr))
+        bytes_per_row = uint(stride >> 3)
         index = uint(y * bytes_per_row + (x >> 3))
         offset = uint(7 - (x & 0x07))  # LSB: bit 7 is leftmost
 
         if c == -1:  # Get pixel
             return int((buf[index] >> offset) & 1)
-        else:  # Set pixel
-            if c:
-                buf[index] |= uint(1 << offset)
-            else:
-                buf[index] &= uint(~(1 << offset) & 0xFF)
+        else:  # Set pixel - branchless clear-then-or, as in the C code
+            buf[index] = uint((buf[index] & ~(1 << offset)) | (uint(c != 0) << offset))
             return 0
 
 
+    @micropython.viper
+    def get_pixel(self, x: int, y: int) -> int:
+        """Get pixel for MONO_HLSB format"""
+        width = int(self.width)
+        height = int(self.height)
+
+        # Bounds check - unsigned comparison handles negative values
+        if uint(x) >= uint(width) or uint(y) >= uint(height):
+            return 0
+
+        stride = int(self.stride)
+        buf = ptr8(int(self._buf_addr))
+        index = uint(y * (stride >> 3) + (x >> 3))
+        return int((buf[index] >> (7 - (x & 0x07))) & 1)  # LSB: bit 7 is leftmost
+
+
+    @micropython.viper
+    def set_pixel(self, x: int, y: int, c: int):
+        """Set pixel for MONO_HLSB format"""
+        width = int(self.width)
+        height = int(self.height)
+
+        # Bounds check - unsigned comparison handles negative values
+        if uint(x) >= uint(width) or uint(y) >= uint(height):
+            return
+
+        stride = int(self.stride)
+        buf = ptr8(int(self._buf_addr))
+        index = uint(y * (stride >> 3) + (x >> 3))
+        offset = uint(7 - (x & 0x07))  # LSB: bit 7 is leftmost
+        buf[index] = uint((buf[index] & ~(1 << offset)) | (uint(c != 0) << offset))
+
+
     @micropython.viper
     def hline(self, x: int, y: int, w: int, c: int):
         """Horizontal line for MONO_HLSB format - handles byte spanning"""
         width = int(self.width)
         height = int(self.height)
-        stride = int(self.stride)
 
-        # Bounds check and clip
-        if y < 0 or y >= height or x >= width:
+        # Bounds check (unsigned compare also rejects negatives) and clip
+        if uint(y) >= uint(height) or x >= width:
             return
 
         if x < 0:
@@ -692,8 +1265,9 @@ class FrameBufferMONO_HLSB(FrameBuffer):
         if w <= 0:
             return
 
-        buf = ptr8(self.buffer)
-        bytes_per_row = uint((stride + 7) >> 3)
+        stride = int(self.stride)
+        buf = ptr8(int(self._buf_addr))
+        bytes_per_row = uint(stride >> 3)
         row_offset = uint(y * bytes_per_row)
 
         # Calculate byte and bit positions
@@ -701,51 +1275,43 @@ class FrameBufferMONO_HLSB(FrameBuffer):
         start_bit = uint(x & 7)
         end_pos = x + w - 1
         end_byte = uint(end_pos >> 3)
+        end_bit = uint(end_pos & 7)
 
-        if c:
-            # Set pixels
-            if start_byte == end_byte:
-                # All pixels in one byte
-                for i in range(w):
-                    bit = uint(7 - ((x + i) & 7))
-                    buf[row_offset + start_byte] |= uint(1 << bit)
+        fill_byte = uint(0xFF if c else 0x00)
+
+        if start_bit == 0 and end_bit == 7:
+            # Run covers whole bytes only (e.g. a full-width row) - plain fill
+            n_bytes = int(end_byte - start_byte) + 1
+            if n_bytes >= 8:
+                _asm_fill_byte(int(self._buf_addr) + int(row_offset + start_byte), n_bytes, int(fill_byte))
             else:
-                # Handle first partial byte
-                for i in range(8 - start_bit):
-                    bit = uint(7 - ((x + i) & 7))
-                    buf[row_offset + start_byte] |= uint(1 << bit)
-
-                # Handle full bytes in the middle
-                for byte_idx in range(start_byte + 1, end_byte):
-                    buf[row_offset + byte_idx] = 0xFF
-
-                # Handle last partial byte
-                end_bit = int(end_pos & 7)
-                for i in range(end_bit + 1):
-                    bit = uint(7 - i)
-                    buf[row_offset + end_byte] |= uint(1 << bit)
+                for i in range(n_bytes):
+                    buf[row_offset + start_byte + i] = fill_byte
+            return
+
+        # Edge byte masks - bit 7 is leftmost, so the head keeps the low bits
+        head_mask = uint(0xFF >> start_bit)
+        tail_mask = uint((0xFF00 >> (end_bit + 1)) & 0xFF)
+
+        # One masked read-modify-write per partial byte, the same code for
+        # set and clear: byte = (byte & ~mask) | (fill_byte & mask)
+        index = row_offset + start_byte
+        if start_byte == end_byte:
+            mask = uint(head_mask & tail_mask)
+            buf[index] = uint((buf[index] & ~mask) | (fill_byte & mask))
         else:
-            # Clear pixels
-            if start_byte == end_byte:
-                # All pixels in one byte
-                for i in range(w):
-                    bit = uint(7 - ((x + i) & 7))
-                    buf[row_offset + start_byte] &= uint(~(1 << bit) & 0xFF)
-            else:
-                # Handle first partial byte
-                for i in range(8 - start_bit):
-                    bit = uint(7 - ((x + i) & 7))
-                    buf[row_offset + start_byte] &= uint(~(1 << bit) & 0xFF)
+            buf[index] = uint((buf[index] & ~head_mask) | (fill_byte & head_mask))
 
-                # Handle full bytes in the middle
-                for byte_idx in range(start_byte + 1, end_byte):
-                    buf[row_offset + byte_idx] = 0x00
+            # Handle full bytes in the middle - word stores for long runs
+            mid_len = int(end_byte - start_byte) - 1
+            if mid_len >= 8:
+                _asm_fill_byte(int(self._buf_addr) + int(index) + 1, mid_len, int(fill_byte))
+            else:
+                for i in range(mid_len):
+                    buf[index + 1 + i] = fill_byte
 
-                # Handle last partial byte
-                end_bit = int(end_pos & 7)
-                for i in range(end_bit + 1):
-                    bit = uint(7 - i)
-                    buf[row_offset + end_byte] &= uint(~(1 << bit) & 0xFF)
+            index = row_offset + end_byte
+            buf[index] = uint((buf[index] & ~tail_mask) | (fill_byte & tail_mask))
 
 
     @micropython.viper
@@ -753,10 +1319,9 @@ class FrameBufferMONO_HLSB(FrameBuffer):
         """Vertical line for MONO_HLSB format"""
         width = int(self.width)
         height = int(self.height)
-        stride = int(self.stride)
 
-        # Bounds check and clip
-        if x < 0 or x >= width or y >= height:
+        # Bounds check (unsigned compare also rejects negatives) and clip
+        if uint(x) >= uint(width) or y >= height:
             return
 
         if y < 0:
@@ -769,59 +1334,75 @@ class FrameBufferMONO_HLSB(FrameBuffer):
         if h <= 0:
             return
 
-        buf = ptr8(self.buffer)
-        bytes_per_row = uint((stride + 7) >> 3)
+        stride = int(self.stride)
+        buf = ptr8(int(self._buf_addr))
+        bytes_per_row = uint(stride >> 3)
         byte_in_row = uint(x >> 3)
         bit_offset = uint(7 - (x & 7))
         mask = uint(1 << bit_offset)
 
-        if c:
-            for i in range(h):
-                row_offset = uint((y + i) * bytes_per_row)
-                buf[row_offset + byte_in_row] |= mask
-        else:
-            inv_mask = uint(~mask & 0xFF)
-            for i in range(h):
-                row_offset = uint((y + i) * bytes_per_row)
-                buf[row_offset + byte_in_row] &= inv_mask
+        # Advance by one row of bytes instead of multiplying per pixel
+        offset = uint(y * bytes_per_row + byte_in_row)
+        keep = uint(~mask & 0xFF)
+        set_bits = mask if c else uint(0)
+        for i in range(h):
+            buf[offset] = uint((buf[offset] & keep) | set_bits)
+            offset += bytes_per_row
 
 
     @micropython.viper
     def _fill_rect_impl(self, x: int, y: int, w: int, h: int, c: int):
         """Fill rectangle for MONO_HLSB format - optimized with viper"""
-        # Check if full-buffer fill for optimization
-        if x == 0 and y == 0 and w == int(self.width) and h == int(self.height):
-            buf = ptr8(self.buffer)
-            height = int(self.height)
-            stride = int(self.stride)
-            bytes_per_row = int((stride + 7) >> 3)
-            fill_byte = uint(0xFF if c else 0x00)
+        width = int(self.width)
+        height = int(self.height)
 
-            # Calculate partial pixels in last byte of each row
-            partial_pixels = int(stride & 0x07)
-
-            if partial_pixels > 0:
-                # Each row has a partial last byte
-                # For HLSB: bits 7...(8-partial_pixels) are used
-                mask = uint((0xFF << (8 - partial_pixels)) & 0xFF)
-                last_byte_fill = uint(fill_byte & mask)
-
-                for row in range(height):
-                    offset = uint(row * bytes_per_row)
-                    # Fill all full bytes in this row
-                    for i in range(bytes_per_row - 1):
-                        buf[offset + i] = fill_byte
-                    # Fill partial last byte with mask
-                    buf[offset + bytes_per_row - 1] = last_byte_fill
-            else:
-                # All bytes are complete, fast fill
-                total_bytes = height * bytes_per_row
-                for i in range(total_bytes):
-                    buf[i] = fill_byte
+        # Full-buffer fill - rows are contiguous whole bytes, one word fill.
+        # If width is short of the (8-aligned) stride, the padding bits must
+        # be left alone as in C, which the partial path below does.
+        if x == 0 and y == 0 and w == width and h == height and width == int(self.stride):
+            _asm_fill_byte(int(self._buf_addr), height * (width >> 3), 0xFF if c else 0x00)
         else:
-            # Partial rectangle - use hline for each row
+            # Partial rectangle (already clipped) - edge masks and the run of
+            # whole bytes are the same for every row, so work them out once.
+            # Byte-aligned rectangles end up as plain whole-byte rows.
+            buf_addr = int(self._buf_addr)
+            buf = ptr8(buf_addr)
+            bytes_per_row = int(self.stride) >> 3
+            fill_byte = uint(0xFF if c else 0x00)
+            start_byte = x >> 3
+            end_pos = x + w - 1
+            end_byte = end_pos >> 3
+            # Edge byte masks - bit 7 is leftmost
+            head_mask = uint(0xFF >> (x & 7))
+            tail_mask = uint((0xFF00 >> ((end_pos & 7) + 1)) & 0xFF)
+            if start_byte == end_byte:
+                # Rectangle within one byte column - head only
+                head_mask &= tail_mask
+                tail_mask = uint(0xFF)
+            head = head_mask != 0xFF
+            tail = tail_mask != 0xFF
+            mid_start = start_byte
+            if head:
+                mid_start += 1
+            n_mid = end_byte + 1 - mid_start
+            if tail:
+                n_mid -= 1
+
+            row_offset = y * bytes_per_row
             for yy in range(h):
-                self._hline_mono_hlsb(x, y + yy, w, c)
+                if head:
+                    index = row_offset + start_byte
+                    buf[index] = uint((buf[index] & ~head_mask) | (fill_byte & head_mask))
+                index = row_offset + mid_start
+                if n_mid >= 8:
+                    _asm_fill_byte(buf_addr + index, n_mid, int(fill_byte))
+                else:
+                    for i in range(n_mid):
+                        buf[index + i] = fill_byte
+                if tail:
+                    index = row_offset + end_byte
+                    buf[index] = uint((buf[index] & ~tail_mask) | (fill_byte & tail_mask))
+                row_offset += bytes_per_row
 
 
 
@@ -834,36 +1415,65 @@ class FrameBufferMONO_HMSB(FrameBuffer):
         """Pixel implementation for MONO_HMSB format"""
         width = int(self.width)
         height = int(self.height)
-        stride = int(self.stride)
 
-        # Bounds check
-        if x < 0 or x >= width or y < 0 or y >= height:
+        # Bounds check - unsigned comparison handles negative values
+        if uint(x) >= uint(width) or uint(y) >= uint(height):
             return 0
 
-        buf = ptr8(self.buffer)
-        bytes_per_row = uint((stride + 7) >> 3)
+        stride = int(self.stride)
+        buf = ptr8(int(self._buf_addr))
+        bytes_per_row = uint(stride >> 3)
         index = uint(y * bytes_per_row + (x >> 3))
         offset = uint(x & 0x07)  # HMSB: bit 0 is leftmost
 
         if c == -1:  # Get pixel
             return int((buf[index] >> offset) & 1)
-        else:  # Set pixel
-            if c:
-                buf[index] |= uint(1 << offset)
-            else:
-                buf[index] &= uint(~(1 << offset) & 0xFF)
+        else:  # Set pixel - branchless clear-then-or, as in the C code
+            buf[index] = uint((buf[index] & ~(1 << offset)) | (uint(c != 0) << offset))
             return 0
 
 
+    @micropython.viper
+    def get_pixel(self, x: int, y: int) -> int:
+        """Get pixel for MONO_HMSB format"""
+        width = int(self.width)
+        height = int(self.height)
+
+        # Bounds check - unsigned comparison handles negative values
+        if uint(x) >= uint(width) or uint(y) >= uint(height):
+            return 0
+
+        stride = int(self.stride)
+        buf = ptr8(int(self._buf_addr))
+        index = uint(y * (stride >> 3) + (x >> 3))
+        return int((buf[index] >> (x & 0x07)) & 1)  # HMSB: bit 0 is leftmost
+
+
+    @micropython.viper
+    def set_pixel(self, x: int, y: int, c: int):
+        """Set pixel for MONO_HMSB format"""
+        width = int(self.width)
+        height = int(self.height)
+
+        # Bounds check - unsigned comparison handles negative values
+        if uint(x) >= uint(width) or uint(y) >= uint(height):
+            return
+
+        stride = int(self.stride)
+        buf = ptr8(int(self._buf_addr))
+        index = uint(y * (stride >> 3) + (x >> 3))
+        offset = uint(x & 0x07)  # HMSB: bit 0 is leftmost
+        buf[index] = uint((buf[index] & ~(1 << offset)) | (uint(c != 0) << offset))
+
+
     @micropython.viper
     def hline(self, x: int, y: int, w: int, c: int):
         """Horizontal line for MONO_HMSB format - handles byte spanning"""
         width = int(self.width)
         height = int(self.height)
-        stride = int(self.stride)
 
-        # Bounds check and clip
-        if y < 0 or y >= height or x >= width:
+        # Bounds check (unsigned compare also rejects negatives) and clip
+        if uint(y) >= uint(height) or x >= width:
             return
 
         if x < 0:
@@ -876,8 +1486,9 @@ class FrameBufferMONO_HMSB(FrameBuffer):
         if w <= 0:
             return
 
-        buf = ptr8(self.buffer)
-        bytes_per_row = uint((stride + 7) >> 3)
+        stride = int(self.stride)
+        buf = ptr8(int(self._buf_addr))
+        bytes_per_row = uint(stride >> 3)
         row_offset = uint(y * bytes_per_row)
 
         # Calculate byte and bit positions
@@ -885,49 +1496,43 @@ class FrameBufferMONO_HMSB(FrameBuffer):
         start_bit = uint(x & 7)
         end_pos = x + w - 1
         end_byte = uint(end_pos >> 3)
+        end_bit = uint(end_pos & 7)
 
-        if c:
-            # Set pixels
-            if start_byte == end_byte:
-                # All pixels in one byte
-                for i in range(w):
-                    bit = uint((x + i) & 7)
-                    buf[row_offset + start_byte] |= uint(1 << bit)
+        fill_byte = uint(0xFF if c else 0x00)
+
+        if start_bit == 0 and end_bit == 7:
+            # Run covers whole bytes only (e.g. a full-width row) - plain fill
+            n_bytes = int(end_byte - start_byte) + 1
+            if n_bytes >= 8:
+                _asm_fill_byte(int(self._buf_addr) + int(row_offset + start_byte), n_bytes, int(fill_byte))
             else:
-                # Handle first partial byte
-                for i in range(8 - start_bit):
-                    bit = uint((x + i) & 7)
-                    buf[row_offset + start_byte] |= uint(1 << bit)
-
-                # Handle full bytes in the middle
-                for byte_idx in range(start_byte + 1, end_byte):
-                    buf[row_offset + byte_idx] = 0xFF
-
-                # Handle last partial byte
-                end_bit = int(end_pos & 7)
-                for i in range(end_bit + 1):
-                    buf[row_offset + end_byte] |= uint(1 << i)
+                for i in range(n_bytes):
+                    buf[row_offset + start_byte + i] = fill_byte
+            return
+
+        # Edge byte masks - bit 0 is leftmost, so the head keeps the high bits
+        head_mask = uint((0xFF << start_bit) & 0xFF)
+        tail_mask = uint((2 << end_bit) - 1)
+
+        # One masked read-modify-write per partial byte, the same code for
+        # set and clear: byte = (byte & ~mask) | (fill_byte & mask)
+        index = row_offset + start_byte
+        if start_byte == end_byte:
+            mask = uint(head_mask & tail_mask)
+            buf[index] = uint((buf[index] & ~mask) | (fill_byte & mask))
         else:
-            # Clear pixels
-            if start_byte == end_byte:
-                # All pixels in one byte
-                for i in range(w):
-                    bit = uint((x + i) & 7)
-                    buf[row_offset + start_byte] &= uint(~(1 << bit) & 0xFF)
-            else:
-                # Handle first partial byte
-                for i in range(8 - start_bit):
-                    bit = uint((x + i) & 7)
-                    buf[row_offset + start_byte] &= uint(~(1 << bit) & 0xFF)
+            buf[index] = uint((buf[index] & ~head_mask) | (fill_byte & head_mask))
 
-                # Handle full bytes in the middle
-                for byte_idx in range(start_byte + 1, end_byte):
-                    buf[row_offset + byte_idx] = 0x00
+            # Handle full bytes in the middle - word stores for long runs
+            mid_len = int(end_byte - start_byte) - 1
+            if mid_len >= 8:
+                _asm_fill_byte(int(self._buf_addr) + int(index) + 1, mid_len, int(fill_byte))
+            else:
+                for i in range(mid_len):
+                    buf[index + 1 + i] = fill_byte
 
-                # Handle last partial byte
-                end_bit = int(end_pos & 7)
-                for i in range(end_bit + 1):
-                    buf[row_offset + end_byte] &= uint(~(1 << i) & 0xFF)
+            index = row_offset + end_byte
+            buf[index] = uint((buf[index] & ~tail_mask) | (fill_byte & tail_mask))
 
 
     @micropython.viper
@@ -935,10 +1540,9 @@ class FrameBufferMONO_HMSB(FrameBuffer):
         """Vertical line for MONO_HMSB format"""
         width = int(self.width)
         height = int(self.height)
-        stride = int(self.stride)
 
-        # Bounds check and clip
-        if x < 0 or x >= width or y >= height:
+        # Bounds check (unsigned compare also rejects negatives) and clip
+        if uint(x) >= uint(width) or y >= height:
             return
 
         if y < 0:
@@ -951,59 +1555,75 @@ class FrameBufferMONO_HMSB(FrameBuffer):
         if h <= 0:
             return
 
-        buf = ptr8(self.buffer)
-        bytes_per_row = uint((stride + 7) >> 3)
+        stride = int(self.stride)
+        buf = ptr8(int(self._buf_addr))
+        bytes_per_row = uint(stride >> 3)
         byte_in_row = uint(x >> 3)
         bit_offset = uint(x & 7)
         mask = uint(1 << bit_offset)
 
-        if c:
-            for i in range(h):
-                row_offset = uint((y + i) * bytes_per_row)
-                buf[row_offset + byte_in_row] |= mask
-        else:
-            inv_mask = uint(~mask & 0xFF)
-            for i in range(h):
-                row_offset = uint((y + i) * bytes_per_row)
-                buf[row_offset + byte_in_row] &= inv_mask
+        # Advance by one row of bytes instead of multiplying per pixel
+        offset = uint(y * bytes_per_row + byte_in_row)
+        keep = uint(~mask & 0xFF)
+        set_bits = mask if c else uint(0)
+        for i in range(h):
+            buf[offset] = uint((buf[offset] & keep) | set_bits)
+            offset += bytes_per_row
 
 
     @micropython.viper
     def _fill_rect_impl(self, x: int, y: int, w: int, h: int, c: int):
         """Fill rectangle for MONO_HMSB format - optimized with viper"""
-        # Check if full-buffer fill for optimization
-        if x == 0 and y == 0 and w == int(self.width) and h == int(self.height):
-            buf = ptr8(self.buffer)
-            height = int(self.height)
-            stride = int(self.stride)
-            bytes_per_row = int((stride + 7) >> 3)
-            fill_byte = uint(0xFF if c else 0x00)
+        width = int(self.width)
+        height = int(self.height)
 
-            # Calculate partial pixels in last byte of each row
-            partial_pixels = int(stride & 0x07)
-
-            if partial_pixels > 0:
-                # Each row has a partial last byte
-                # For HMSB: bits 0...(partial_pixels-1) are used
-                mask = uint((1 << partial_pixels) - 1)
-                last_byte_fill = uint(fill_byte & mask)
-
-                for row in range(height):
-                    offset = uint(row * bytes_per_row)
-                    # Fill all full bytes in this row
-                    for i in range(bytes_per_row - 1):
-                        buf[offset + i] = fill_byte
-                    # Fill partial last byte with mask
-                    buf[offset + bytes_per_row - 1] = last_byte_fill
-            else:
-                # All bytes are complete, fast fill
-                total_bytes = height * bytes_per_row
-                for i in range(total_bytes):
-                    buf[i] = fill_byte
+        # Full-buffer fill - rows are contiguous whole bytes, one word fill.
+        # If width is short of the (8-aligned) stride, the padding bits must
+        # be left alone as in C, which the partial path below does.
+        if x == 0 and y == 0 and w == width and h == height and width == int(self.stride):
+            _asm_fill_byte(int(self._buf_addr), height * (width >> 3), 0xFF if c else 0x00)
         else:
-            # Partial rectangle - use hline for each row
+            # Partial rectangle (already clipped) - edge masks and the run of
+            # whole bytes are the same for every row, so work them out once.
+            # Byte-aligned rectangles end up as plain whole-byte rows.
+            buf_addr = int(self._buf_addr)
+            buf = ptr8(buf_addr)
+            bytes_per_row = int(self.stride) >> 3
+            fill_byte = uint(0xFF if c else 0x00)
+            start_byte = x >> 3
+            end_pos = x + w - 1
+            end_byte = end_pos >> 3
+            # Edge byte masks - bit 0 is leftmost
+            head_mask = uint((0xFF << (x & 7)) & 0xFF)
+            tail_mask = uint((2 << (end_pos & 7)) - 1)
+            if start_byte == end_byte:
+                # Rectangle within one byte column - head only
+                head_mask &= tail_mask
+                tail_mask = uint(0xFF)
+            head = head_mask != 0xFF
+            tail = tail_mask != 0xFF
+            mid_start = start_byte
+            if head:
+                mid_start += 1
+            n_mid = end_byte + 1 - mid_start
+            if tail:
+                n_mid -= 1
+
+            row_offset = y * bytes_per_row
             for yy in range(h):
-                self._hline_mono_hmsb(x, y + yy, w, c)
+                if head:
+                    index = row_offset + start_byte
+                    buf[index] = uint((buf[index] & ~head_mask) | (fill_byte & head_mask))
+                index = row_offset + mid_start
+                if n_mid >= 8:
+                    _asm_fill_byte(buf_addr + index, n_mid, int(fill_byte))
+                else:
+                    for i in range(n_mid):
+                        buf[index + i] = fill_byte
+                if tail:
+                    index = row_offset + end_byte
+                    buf[index] = uint((buf[index] & ~tail_mask) | (fill_byte & tail_mask))
+                row_offset += bytes_per_row
 
 
 
@@ -1016,13 +1636,13 @@ class FrameBufferGS2_HMSB(FrameBuffer):
         """Pixel implementation for GS2_HMSB format"""
         width = int(self.width)
         height = int(self.height)
-        stride = int(self.stride)
 
-        # Bounds check
-        if x < 0 or x >= width or y < 0 or y >= height:
+        # Bounds check - unsigned comparison handles negative values
+        if uint(x) >= uint(width) or uint(y) >= uint(height):
             return 0
 
-        buf = ptr8(self.buffer)
+        stride = int(self.stride)
+        buf = ptr8(int(self._buf_addr))
         index = uint((y * stride + x) >> 2)
         shift = uint((x & 0x3) << 1)
         mask = uint(0x3 << shift)
@@ -1036,38 +1656,91 @@ class FrameBufferGS2_HMSB(FrameBuffer):
 
 
     @micropython.viper
-    def hline(self, x: int, y: int, w: int, c: int):
-        """Horizontal line for GS2_HMSB format"""
+    def get_pixel(self, x: int, y: int) -> int:
+        """Get pixel for GS2_HMSB format"""
         width = int(self.width)
         height = int(self.height)
+
+        # Bounds check - unsigned comparison handles negative values
+        if uint(x) >= uint(width) or uint(y) >= uint(height):
+            return 0
+
         stride = int(self.stride)
+        buf = ptr8(int(self._buf_addr))
+        return int((buf[(y * stride + x) >> 2] >> ((x & 0x3) << 1)) & 0x3)
+
 
-        # Bounds check and clip
-        if y < 0 or y >= height or x >= width:
+    @micropython.viper
+    def set_pixel(self, x: int, y: int, c: int):
+        """Set pixel for GS2_HMSB format"""
+        width = int(self.width)
+        height = int(self.height)
+
+        # Bounds check - unsigned comparison handles negative values
+        if uint(x) >= uint(width) or uint(y) >= uint(height):
             return
 
-        if x < 0:
-            w += x
-            x = 0
+        stride = int(self.stride)
+        buf = ptr8(int(self._buf_addr))
+        index = uint((y * stride + x) >> 2)
+        shift = uint((x & 0x3) << 1)
+        buf[index] = uint((buf[index] & ~(0x3 << shift)) | ((c & 0x3) << shift))
 
-        if x + w > width:
-            w = width - x
 
-        if w <= 0:
+    @micropython.viper
+    def hline(self, x: int, y: int, w: int, c: int):
+        """Horizontal line for GS2_HMSB format"""
+        width = int(self.width)
+        height = int(self.height)
+
+        # Branchless clip: x0 = max(x, 0), x1 = min(x + w, width)
+        x1 = x + w
+        x0 = x & ~(x >> 31)
+        d = x1 - width
+        x1 -= d & ~(d >> 31)
+        w = x1 - x0
+        x = x0
+
+        # Single early out - also covers x >= width (w <= 0 then)
+        if w <= 0 or uint(y) >= uint(height):
             return
 
-        buf = ptr8(self.buffer)
-        row_offset = uint((y * stride) >> 2)
+        stride = int(self.stride)
+        buf = ptr8(int(self._buf_addr))
+        row_offset = uint(y * (stride >> 2))
         c_bits = uint(c & 0x3)
+        c_byte = uint(c_bits * 0x55)  # Colour replicated into all 4 pixel slots
 
-        # Set pixels one by one (simpler and safer for 2-bit format)
-        for i in range(w):
-            x_pos = x + i
-            idx = uint(x_pos >> 2)
-            shift = uint((x_pos & 0x3) << 1)
-            mask = uint(0x3 << shift)
-            color = uint(c_bits << shift)
-            buf[row_offset + idx] = uint((buf[row_offset + idx] & ~mask) | color)
+        start_byte = uint(x >> 2)
+        end_pos = x + w - 1
+        end_byte = uint(end_pos >> 2)
+
+        # Edge byte masks - pixel 0 of a byte sits in the low bits
+        head_mask = uint((0xFF << ((x & 3) << 1)) & 0xFF)
+        tail_mask = uint((4 << ((end_pos & 3) << 1)) - 1)
+
+        if start_byte == end_byte:
+            # All pixels in one byte - single masked RMW
+            mask = uint(head_mask & tail_mask)
+            offset = row_offset + start_byte
+            buf[offset] = uint((buf[offset] & ~mask) | (c_byte & mask))
+            return
+
+        # Partial head byte - one masked RMW
+        offset = row_offset + start_byte
+        buf[offset] = uint((buf[offset] & ~head_mask) | (c_byte & head_mask))
+
+        # Full bytes in between - plain stores, no read needed
+        mid_len = int(end_byte - start_byte) - 1
+        if mid_len >= 8:
+            _asm_fill_byte(int(self._buf_addr) + int(row_offset + start_byte) + 1, mid_len, int(c_byte))
+        else:
+            for i in range(start_byte + 1, end_byte):
+                buf[row_offset + i] = c_byte
+
+        # Partial tail byte - one masked RMW
+        offset = row_offset + end_byte
+        buf[offset] = uint((buf[offset] & ~tail_mask) | (c_byte & tail_mask))
 
 
     @micropython.viper
@@ -1075,52 +1748,87 @@ class FrameBufferGS2_HMSB(FrameBuffer):
         """Vertical line for GS2_HMSB format"""
         width = int(self.width)
         height = int(self.height)
-        stride = int(self.stride)
-
-        # Bounds check and clip
-        if x < 0 or x >= width or y >= height:
-            return
 
-        if y < 0:
-            h += y
-            y = 0
+        # Branchless clip: y0 = max(y, 0), y1 = min(y + h, height)
+        y1 = y + h
+        y0 = y & ~(y >> 31)
+        d = y1 - height
+        y1 -= d & ~(d >> 31)
+        h = y1 - y0
+        y = y0
 
-        if y + h > height:
-            h = height - y
-
-        if h <= 0:
+        # Single early out - also covers y >= height (h <= 0 then)
+        if h <= 0 or uint(x) >= uint(width):
             return
 
-        buf = ptr8(self.buffer)
-        c_bits = uint(c & 0x3)
+        stride = int(self.stride)
+        buf = ptr8(int(self._buf_addr))
+        # Everything but the row offset is loop invariant - compute once
         shift = uint((x & 0x3) << 1)
-        mask = uint(0x3 << shift)
-        color = uint(c_bits << shift)
-        byte_in_row = uint(x >> 2)
-
+        keep = uint(~(0x3 << shift) & 0xFF)
+        color = uint((c & 0x3) << shift)
+        # Advance by one row of bytes instead of multiplying per pixel
+        bytes_per_row = stride >> 2
+        offset = y * bytes_per_row + (x >> 2)
+        if h >= 8:
+            # Tall line - masked strided RMW kernel in asm
+            _asm_rmw_stride(int(self._buf_addr) + offset, bytes_per_row, h, int((keep << 8) | color))
+            return
         for i in range(h):
-            row_offset = uint(((y + i) * stride) >> 2)
-            buf[row_offset + byte_in_row] = uint((buf[row_offset + byte_in_row] & ~mask) | color)
+            buf[offset] = uint((buf[offset] & keep) | color)
+            offset += bytes_per_row
 
 
     @micropython.viper
     def _fill_rect_impl(self, x: int, y: int, w: int, h: int, c: int):
         """Fill rectangle for GS2_HMSB format"""
-        # Check if full-buffer fill for optimization
-        if x == 0 and y == 0 and w == int(self.width) and h == int(self.height):
-            buf = ptr8(self.buffer)
-            height = int(self.height)
-            stride = int(self.stride)
-            c_bits = uint(c & 0x3)
-            c_byte = uint((c_bits << 6) | (c_bits << 4) | (c_bits << 2) | c_bits)
-            bytes_per_row = int((stride + 3) >> 2)
-            total_bytes = height * bytes_per_row
-            for i in range(total_bytes):
-                buf[i] = c_byte
+        width = int(self.width)
+        height = int(self.height)
+
+        stride = int(self.stride)
+        c_byte = (c & 0x3) * 0x55  # Colour replicated into all 4 pixel slots
+        bytes_per_row = stride >> 2
+
+        # Check if full-buffer fill for optimization - only without padding
+        # pixels (width == stride), which C leaves untouched
+        if x == 0 and y == 0 and w == width and h == height and width == stride:
+            # Rows are contiguous - one flat word fill over the whole buffer
+            _asm_fill_byte(int(self._buf_addr), height * bytes_per_row, c_byte)
         else:
-            # Partial rectangle - use hline for each row
+            # Partial rectangle (already clipped) - the edge masks are the
+            # same for every row, so compute them once and step the row
+            # offset by addition instead of calling hline per row
+            buf_addr = int(self._buf_addr)
+            buf = ptr8(buf_addr)
+            start_byte = x >> 2
+            end_pos = x + w - 1
+            end_byte = end_pos >> 2
+            head_mask = uint((0xFF << ((x & 3) << 1)) & 0xFF)
+            tail_mask = uint((4 << ((end_pos & 3) << 1)) - 1)
+            if start_byte == end_byte:
+                head_mask &= tail_mask
+            head_keep = uint(~head_mask & 0xFF)
+            head_set = uint(c_byte & head_mask)
+            tail_keep = uint(~tail_mask & 0xFF)
+            tail_set = uint(c_byte & tail_mask)
+
+            mid_len = end_byte - start_byte - 1
+
+            row = y * bytes_per_row
             for yy in range(h):
-                self._hline_gs2_hmsb(x, y + yy, w, c)
+                # Head, middle, tail - writes in increasing address order
+                offset = row + start_byte
+                buf[offset] = uint((buf[offset] & head_keep) | head_set)
+                if end_byte != start_byte:
+                    if mid_len >= 8:
+                        # Long middle run - word stores in asm
+                        _asm_fill_byte(buf_addr + offset + 1, mid_len, c_byte)
+                    else:
+                        for i in range(start_byte + 1, end_byte):
+                            buf[row + i] = c_byte
+                    offset = row + end_byte
+                    buf[offset] = uint((buf[offset] & tail_keep) | tail_set)
+                row += bytes_per_row
 
 
 
@@ -1133,13 +1841,13 @@ class FrameBufferGS8(FrameBuffer):
         """Pixel implementation for GS8 format - optimized"""
         width = int(self.width)
         height = int(self.height)
-        stride = int(self.stride)
 
         # Bounds check - unsigned comparison handles negative values
         if uint(x) >= uint(width) or uint(y) >= uint(height):
             return 0
 
-        buf = ptr8(self.buffer)
+        stride = int(self.stride)
+        buf = ptr8(int(self._buf_addr))
         index = uint(y * stride + x)
 
         if c == -1:  # Get pixel
@@ -1150,14 +1858,43 @@ class FrameBufferGS8(FrameBuffer):
 
 
     @micropython.viper
-    def hline(self, x: int, y: int, w: int, c: int):
-        """Horizontal line for GS8 format"""
+    def get_pixel(self, x: int, y: int) -> int:
+        """Get pixel for GS8 format"""
         width = int(self.width)
         height = int(self.height)
+
+        # Bounds check - unsigned comparison handles negative values
+        if uint(x) >= uint(width) or uint(y) >= uint(height):
+            return 0
+
         stride = int(self.stride)
+        buf = ptr8(int(self._buf_addr))
+        return int(buf[y * stride + x])
 
-        # Bounds check and clip
-        if y < 0 or y >= height or x >= width:
+
+    @micropython.viper
+    def set_pixel(self, x: int, y: int, c: int):
+        """Set pixel for GS8 format"""
+        width = int(self.width)
+        height = int(self.height)
+
+        # Bounds check - unsigned comparison handles negative values
+        if uint(x) >= uint(width) or uint(y) >= uint(height):
+            return
+
+        stride = int(self.stride)
+        buf = ptr8(int(self._buf_addr))
+        buf[y * stride + x] = uint(c & 0xFF)
+
+
+    @micropython.viper
+    def hline(self, x: int, y: int, w: int, c: int):
+        """Horizontal line for GS8 format - optimized with asm_thumb"""
+        width = int(self.width)
+        height = int(self.height)
+
+        # Bounds check (unsigned compare also rejects negatives) and clip
+        if uint(y) >= uint(height) or x >= width:
             return
 
         if x < 0:
@@ -1170,11 +1907,25 @@ class FrameBufferGS8(FrameBuffer):
         if w <= 0:
             return
 
-        buf = ptr8(self.buffer)
+        stride = int(self.stride)
+        buf = ptr8(int(self._buf_addr))
         offset = uint(y * stride + x)
         c_byte = uint(c & 0xFF)
 
-        # Simple sequential byte writes
+        if w >= 8:
+            # memset kernel: aligned head, word stores, byte tail
+            _asm_fill_byte(int(self._buf_addr) + int(offset), w, int(c_byte))
+            return
+
+        # Short line - halfword stores when start address and length are
+        # both even, otherwise sequential byte writes
+        addr = int(self._buf_addr) + int(offset)
+        if ((addr | w) & 1) == 0:
+            buf16 = ptr16(addr)
+            c2 = uint(c_byte | (c_byte << 8))
+            for i in range(w >> 1):
+                buf16[i] = c2
+            return
         for i in range(w):
             buf[offset + i] = c_byte
 
@@ -1184,10 +1935,9 @@ class FrameBufferGS8(FrameBuffer):
         """Vertical line for GS8 format"""
         width = int(self.width)
         height = int(self.height)
-        stride = int(self.stride)
 
-        # Bounds check and clip
-        if x < 0 or x >= width or y >= height:
+        # Bounds check (unsigned compare also rejects negatives) and clip
+        if uint(x) >= uint(width) or y >= height:
             return
 
         if y < 0:
@@ -1200,52 +1950,88 @@ class FrameBufferGS8(FrameBuffer):
         if h <= 0:
             return
 
-        buf = ptr8(self.buffer)
+        stride = int(self.stride)
+        buf = ptr8(int(self._buf_addr))
         c_byte = uint(c & 0xFF)
 
-        # Write 1 byte per pixel, advance by stride
-        for i in range(h):
-            offset = uint((y + i) * stride + x)
+        # Write 1 byte per pixel, advance by stride (no multiply per row)
+        offset = y * stride + x
+        if h >= 16:
+            # Tall line - strided store kernel in asm
+            _asm_fill_stride(int(self._buf_addr) + offset, stride, h, int(c_byte))
+            return
+        # Unrolled by 4 rows, then the 0-3 row tail
+        stride2 = stride << 1
+        stride3 = stride2 + stride
+        stride4 = stride << 2
+        for i in range(h >> 2):
+            buf[offset] = c_byte
+            buf[offset + stride] = c_byte
+            buf[offset + stride2] = c_byte
+            buf[offset + stride3] = c_byte
+            offset += stride4
+        for i in range(h & 3):
             buf[offset] = c_byte
+            offset += stride
 
 
     @micropython.viper
     def _fill_rect_impl(self, x: int, y: int, w: int, h: int, c: int):
         """Fill rectangle for GS8 format - optimized with asm_thumb"""
+        width = int(self.width)
         height = int(self.height)
         stride = int(self.stride)
         c_byte = int(c & 0xFF)
+        buf_addr = int(self._buf_addr)
 
-        # Check if this is a full-buffer fill - use optimized asm path
-        if x == 0 and y == 0 and w == int(self.width) and h == height:
+        # Full-buffer fill - one flat word fill, only when there are no
+        # padding bytes (width == stride), which C leaves untouched
+        if x == 0 and y == 0 and w == width and h == height and width == stride:
             total_bytes = height * stride
-            buf_addr = int(addressof(self.buffer))
             _asm_fill_byte(buf_addr, total_bytes, c_byte)
+        elif x == 0 and w == stride:
+            # Full-width band - rows are contiguous, one memset for all of them
+            _asm_fill_byte(buf_addr + y * stride, h * stride, c_byte)
         else:
-            # Partial fill - use memset per row like C implementation
+            # Partial fill - use memset per row like C implementation.
+            # Rows generally start unaligned; _asm_fill_byte aligns before
+            # its word stores, so no unaligned str can fault.
+            row_addr = buf_addr + y * stride + x
+            if w < 8:
+                # Narrow rows - the asm call costs more than the stores,
+                # write the bytes inline
+                buf = ptr8(row_addr)
+                offset = 0
+                for yy in range(h):
+                    for i in range(w):
+                        buf[offset + i] = c_byte
+                    offset += stride
+                return
             for yy in range(h):
-                offset = uint((y + yy) * stride + x)
-                # Fill this row using asm helper for speed
-                buf_addr = int(addressof(self.buffer)) + offset
-                _asm_fill_byte(buf_addr, w, c_byte)
+                _asm_fill_byte(row_addr, w, c_byte)
+                row_addr += stride
 
 
 # ====================================================================
 # FACTORY FUNCTION FOR C API COMPATIBILITY
 # ====================================================================
 
-_FRAMEBUFFER_CLASSES = {
-    MONO_VLSB: FrameBufferMONO_VLSB,
-    RGB565: FrameBufferRGB565,
-    GS4_HMSB: FrameBufferGS4_HMSB,
-    MONO_HLSB: FrameBufferMONO_HLSB,
-    MONO_HMSB: FrameBufferMONO_HMSB,
-    GS2_HMSB: FrameBufferGS2_HMSB,
-    GS8: FrameBufferGS8,
-}
+# Indexed by format constant (0-6) - a tuple load instead of a dict lookup
+_FRAMEBUFFER_CLASSES = (
+    FrameBufferMONO_VLSB,
+    FrameBufferRGB565,
+    FrameBufferGS4_HMSB,
+    FrameBufferMONO_HLSB,
+    FrameBufferMONO_HMSB,
+    FrameBufferGS2_HMSB,
+    FrameBufferGS8,
+)
 
 def _create_framebuffer(buffer, width, height, format, stride=None):
     """Factory function - creates appropriate subclass based on format"""
+    # Range check first - a negative index would silently pick a class
+    if not 0 <= format < len(_FRAMEBUFFER_CLASSES):
+        raise ValueError("invalid format")
     cls = _FRAMEBUFFER_CLASSES[format]
     return cls(buffer, width, height, stride)
 
@@ -16,6 +16,8 @@ except ImportError:
     HAS_C_FRAMEBUF = False
     print("WARNING: Built-in framebuf not available, testing pure implementation only")
 
+from array import array
+
 
 def hex_dump(buf, width=16):
     """Pretty print buffer as hex dump"""
@@ -250,6 +252,86 @@ def test_mono_vlsb_fill():
     return True
 
 
+def test_mono_vlsb_fill_rect():
+    """Test MONO_VLSB partial fill_rect: edges, aligned spans, columns, bands, clipping"""
+    w, h = 23, 20
+    size = ((h + 7) // 8) * w
+    colors = [1, 0]
+    test_cases = [
+        (3, 1, 9, 4),            # odd x, odd w (partial head and tail)
+        (9, 2, 3, 3),            # a few pixels in the middle
+        (8, 4, 2, 2),            # within one byte column
+        (8, 3, 16, 2),           # byte-aligned span
+        (1, 1, w - 2, h - 2),    # long rows
+        (5, 0, 2, h),            # tall narrow, odd x
+        (6, 0, 3, h),            # tall narrow, even x
+        (0, 4, w, 3),            # full-width band
+        (-3, -2, 7, 5),          # clipped at negative x/y
+        (w - 5, h - 2, 10, 10),  # clipped at right/bottom
+    ]
+
+    # Non-zero background so masked writes must keep neighbouring pixels
+    init = bytes((i * 37 + 11) & 0xFF for i in range(size))
+
+    if HAS_C_FRAMEBUF:
+        buf_c = bytearray(init)
+        fb_c = framebuf.FrameBuffer(buf_c, w, h, framebuf.MONO_VLSB)
+
+    buf_py = bytearray(init)
+    fb_py = framebuf_pure.FrameBuffer(buf_py, w, h, framebuf_pure.MONO_VLSB)
+
+    for i, (x, y, rw, rh) in enumerate(test_cases):
+        c = colors[i % len(colors)]
+        if HAS_C_FRAMEBUF:
+            fb_c.fill_rect(x, y, rw, rh, c)
+        fb_py.fill_rect(x, y, rw, rh, c)
+        if HAS_C_FRAMEBUF and not compare_buffers(buf_c, buf_py, f"MONO_VLSB fill_rect({x}, {y}, {rw}, {rh}, {c})"):
+            return False
+
+    print("✓ MONO_VLSB fill_rect test passed")
+    return True
+
+
+def test_mono_vlsb_get_set_pixel():
+    """Test MONO_VLSB get_pixel/set_pixel against C pixel()"""
+    w, h = 11, 13
+    size = ((h + 7) // 8) * w
+    test_cases = [(0, 0, 1), (3, 7, 1), (3, 8, 0), (10, 12, 1), (5, 5, 0), (4, 9, 2), (-1, 2, 1), (2, 13, 1)]
+
+    # Non-zero background so set_pixel must keep neighbouring pixels
+    init = bytes((i * 37 + 11) & 0xFF for i in range(size))
+
+    if HAS_C_FRAMEBUF:
+        buf_c = bytearray(init)
+        fb_c = framebuf.FrameBuffer(buf_c, w, h, framebuf.MONO_VLSB)
+
+    buf_py = bytearray(init)
+    fb_py = framebuf_pure.FrameBuffer(buf_py, w, h, framebuf_pure.MONO_VLSB)
+
+    for x, y, c in test_cases:
+        if HAS_C_FRAMEBUF:
+            fb_c.pixel(x, y, c)
+        fb_py.set_pixel(x, y, c)
+
+    if HAS_C_FRAMEBUF and not compare_buffers(buf_c, buf_py, "MONO_VLSB set_pixel"):
+        return False
+
+    for y in range(h):
+        for x in range(w):
+            expected = fb_c.pixel(x, y) if HAS_C_FRAMEBUF else fb_py.pixel(x, y)
+            if fb_py.get_pixel(x, y) != expected:
+                print(f"❌ FAILED: MONO_VLSB get_pixel({x}, {y}) returned {fb_py.get_pixel(x, y)}, expected {expected}")
+                return False
+
+    for x, y in [(-1, 0), (0, -1), (w, 0), (0, h)]:
+        if fb_py.get_pixel(x, y) != 0:
+            print(f"❌ FAILED: MONO_VLSB get_pixel({x}, {y}) out of bounds returned {fb_py.get_pixel(x, y)}")
+            return False
+
+    print("✓ MONO_VLSB get_pixel/set_pixel test passed")
+    return True
+
+
 def test_mono_vlsb_edge_cases():
     """Test MONO_VLSB edge cases"""
     w, h = 20, 32
@@ -361,6 +443,36 @@ def test_mono_vlsb_realistic_size():
     return True
 
 
+def test_mono_vlsb_rect():
+    """Test MONO_VLSB rect outlines: degenerate, thin, normal and off-screen"""
+    w, h = 13, 20
+    size = ((h + 7) // 8) * w
+    test_cases = [
+        (3, 3, 0, 5), (3, 3, 5, 0), (3, 3, -2, 4), (2, 2, 4, -3),  # w or h <= 0
+        (1, 1, 1, 6), (2, 3, 7, 2), (4, 4, 2, 2), (5, 1, 2, 9),     # 1 or 2 wide
+        (2, 1, 9, 6), (0, 0, w, h),                                 # normal outline
+        (-3, -2, 8, 6), (w - 4, h - 3, 10, 10), (-2, 3, w + 4, 2),  # partly off-screen
+        (w + 2, 1, 4, 4), (-10, -10, 5, 5), (1, h, 4, 4),           # fully off-screen
+    ]
+
+    if HAS_C_FRAMEBUF:
+        buf_c = bytearray(size)
+        fb_c = framebuf.FrameBuffer(buf_c, w, h, framebuf.MONO_VLSB)
+
+    buf_py = bytearray(size)
+    fb_py = framebuf_pure.FrameBuffer(buf_py, w, h, framebuf_pure.MONO_VLSB)
+
+    for x, y, rw, rh in test_cases:
+        if HAS_C_FRAMEBUF:
+            fb_c.rect(x, y, rw, rh, 1)
+        fb_py.rect(x, y, rw, rh, 1)
+        if HAS_C_FRAMEBUF and not compare_buffers(buf_c, buf_py, f"MONO_VLSB rect({x}, {y}, {rw}, {rh})"):
+            return False
+
+    print("✓ MONO_VLSB rect test passed")
+    return True
+
+
 # ========================================================================
 # RGB565 Tests
 # ========================================================================
@@ -484,6 +596,116 @@ def test_rgb565_fill():
     return True
 
 
+def test_rgb565_fill_rect():
+    """Test RGB565 partial fill_rect: edges, aligned spans, columns, bands, clipping"""
+    w, h = 45, 12
+    size = w * h * 2
+    colors = [0x1234, 0xF800, 0]
+    test_cases = [
+        (3, 1, 9, 4),            # odd x, odd w (partial head and tail)
+        (9, 2, 3, 3),            # a few pixels in the middle
+        (8, 4, 2, 2),            # within one byte column
+        (8, 3, 16, 2),           # byte-aligned span
+        (1, 1, w - 2, h - 2),    # long rows
+        (5, 0, 2, h),            # tall narrow, odd x
+        (6, 0, 3, h),            # tall narrow, even x
+        (0, 4, w, 3),            # full-width band
+        (-3, -2, 7, 5),          # clipped at negative x/y
+        (w - 5, h - 2, 10, 10),  # clipped at right/bottom
+    ]
+
+    # Non-zero background so masked writes must keep neighbouring pixels
+    init = bytes((i * 37 + 11) & 0xFF for i in range(size))
+
+    if HAS_C_FRAMEBUF:
+        buf_c = bytearray(init)
+        fb_c = framebuf.FrameBuffer(buf_c, w, h, framebuf.RGB565)
+
+    buf_py = bytearray(init)
+    fb_py = framebuf_pure.FrameBuffer(buf_py, w, h, framebuf_pure.RGB565)
+
+    for i, (x, y, rw, rh) in enumerate(test_cases):
+        c = colors[i % len(colors)]
+        if HAS_C_FRAMEBUF:
+            fb_c.fill_rect(x, y, rw, rh, c)
+        fb_py.fill_rect(x, y, rw, rh, c)
+        if HAS_C_FRAMEBUF and not compare_buffers(buf_c, buf_py, f"RGB565 fill_rect({x}, {y}, {rw}, {rh}, {c})"):
+            return False
+
+    print("✓ RGB565 fill_rect test passed")
+    return True
+
+
+def test_rgb565_get_set_pixel():
+    """Test RGB565 get_pixel/set_pixel against C pixel()"""
+    w, h = 7, 5
+    size = w * h * 2
+    test_cases = [(0, 0, 0xF800), (1, 0, 0x07E0), (6, 4, 0x001F), (3, 2, 0x12345), (4, 2, -1), (-1, 2, 9), (2, 5, 9)]
+
+    # Non-zero background so set_pixel must keep neighbouring pixels
+    init = bytes((i * 37 + 11) & 0xFF for i in range(size))
+
+    if HAS_C_FRAMEBUF:
+        buf_c = bytearray(init)
+        fb_c = framebuf.FrameBuffer(buf_c, w, h, framebuf.RGB565)
+
+    buf_py = bytearray(init)
+    fb_py = framebuf_pure.FrameBuffer(buf_py, w, h, framebuf_pure.RGB565)
+
+    for x, y, c in test_cases:
+        if HAS_C_FRAMEBUF:
+            fb_c.pixel(x, y, c)
+        fb_py.set_pixel(x, y, c)
+
+    if HAS_C_FRAMEBUF and not compare_buffers(buf_c, buf_py, "RGB565 set_pixel"):
+        return False
+
+    for y in range(h):
+        for x in range(w):
+            expected = fb_c.pixel(x, y) if HAS_C_FRAMEBUF else fb_py.pixel(x, y)
+            if fb_py.get_pixel(x, y) != expected:
+                print(f"❌ FAILED: RGB565 get_pixel({x}, {y}) returned {fb_py.get_pixel(x, y)}, expected {expected}")
+                return False
+
+    for x, y in [(-1, 0), (0, -1), (w, 0), (0, h)]:
+        if fb_py.get_pixel(x, y) != 0:
+            print(f"❌ FAILED: RGB565 get_pixel({x}, {y}) out of bounds returned {fb_py.get_pixel(x, y)}")
+            return False
+
+    print("✓ RGB565 get_pixel/set_pixel test passed")
+    return True
+
+
+def test_rgb565_rect():
+    """Test RGB565 rect outlines: degenerate, thin, normal and off-screen"""
+    w, h = 13, 10
+    size = w * h * 2
+    test_cases = [
+        (3, 3, 0, 5), (3, 3, 5, 0), (3, 3, -2, 4), (2, 2, 4, -3),  # w or h <= 0
+        (1, 1, 1, 6), (2, 3, 7, 2), (4, 4, 2, 2), (5, 1, 2, 9),     # 1 or 2 wide
+        (2, 1, 9, 6), (0, 0, w, h),                                 # normal outline
+        (-3, -2, 8, 6), (w - 4, h - 3, 10, 10), (-2, 3, w + 4, 2),  # partly off-screen
+        (w + 2, 1, 4, 4), (-10, -10, 5, 5), (1, h, 4, 4),           # fully off-screen
+    ]
+
+    if HAS_C_FRAMEBUF:
+        buf_c = bytearray(size)
+        fb_c = framebuf.FrameBuffer(buf_c, w, h, framebuf.RGB565)
+
+    buf_py = bytearray(size)
+    fb_py = framebuf_pure.FrameBuffer(buf_py, w, h, framebuf_pure.RGB565)
+
+    for x, y, rw, rh in test_cases:
+        if HAS_C_FRAMEBUF:
+            fb_c.rect(x, y, rw, rh, 0xF81F)
+        fb_py.rect(x, y, rw, rh, 0xF81F)
+        if HAS_C_FRAMEBUF and not compare_buffers(buf_c, buf_py, f"RGB565 rect({x}, {y}, {rw}, {rh})"):
+            return False
+
+    print("✓ RGB565 rect test passed")
+    return True
+
+
 # ========================================================================
 # GS8 Tests
 # ========================================================================
@@ -598,6 +820,122 @@ def test_gs8_fill():
     return True
 
 
+def test_gs8_fill_rect():
+    """Test GS8 partial fill_rect: edges, aligned spans, columns, bands, clipping"""
+    w, h = 29, 12
+    size = w * h
+    colors = [0x3C, 0xFF, 0]
+    test_cases = [
+        (3, 1, 9, 4),            # odd x, odd w (partial head and tail)
+        (9, 2, 3, 3),            # a few pixels in the middle
+        (8, 4, 2, 2),            # within one byte column
+        (8, 3, 16, 2),           # byte-aligned span
+        (1, 1, w - 2, h - 2),    # long rows
+        (5, 0, 2, h),            # tall narrow, odd x
+        (6, 0, 3, h),            # tall narrow, even x
+        (0, 4, w, 3),            # full-width band
+        (-3, -2, 7, 5),          # clipped at negative x/y
+        (w - 5, h - 2, 10, 10),  # clipped at right/bottom
+    ]
+
+    # Non-zero background so masked writes must keep neighbouring pixels
+    init = bytes((i * 37 + 11) & 0xFF for i in range(size))
+
+    if HAS_C_FRAMEBUF:
+        buf_c = bytearray(init)
+        fb_c = framebuf.FrameBuffer(buf_c, w, h, framebuf.GS8)
+
+    buf_py = bytearray(init)
+    fb_py = framebuf_pure.FrameBuffer(buf_py, w, h, framebuf_pure.GS8)
+
+    for i, (x, y, rw, rh) in enumerate(test_cases):
+        c = colors[i % len(colors)]
+        if HAS_C_FRAMEBUF:
+            fb_c.fill_rect(x, y, rw, rh, c)
+        fb_py.fill_rect(x, y, rw, rh, c)
+        if HAS_C_FRAMEBUF and not compare_buffers(buf_c, buf_py, f"GS8 fill_rect({x}, {y}, {rw}, {rh}, {c})"):
+            return False
+
+    print("✓ GS8 fill_rect test passed")
+    return True
+
+
+def test_gs8_get_set_pixel():
+    """Test GS8 get_pixel/set_pixel against pixel()"""
+    w, h = 10, 10
+    size = w * h
+
+    if HAS_C_FRAMEBUF:
+        buf_c = bytearray(size)
+        fb_c = framebuf.FrameBuffer(buf_c, w, h, framebuf.GS8)
+
+    buf_py = bytearray(size)
+    fb_py = framebuf_pure.FrameBuffer(buf_py, w, h, framebuf_pure.GS8)
+
+    test_cases = [(0, 0, 255), (5, 5, 128), (9, 9, 64), (3, 7, -1), (-1, 2, 9), (2, 10, 9)]
+    for x, y, c in test_cases:
+        if HAS_C_FRAMEBUF:
+            fb_c.pixel(x, y, c)
+        fb_py.set_pixel(x, y, c)
+
+    if HAS_C_FRAMEBUF and not compare_buffers(buf_c, buf_py, "GS8 set_pixel"):
+        return False
+
+    for x, y, c in test_cases[:4]:
+        if fb_py.get_pixel(x, y) != c & 0xFF:
+            print(f"❌ FAILED: get_pixel({x}, {y}) returned {fb_py.get_pixel(x, y)}, expected {c & 0xFF}")
+            return False
+
+    print("✓ GS8 get_pixel/set_pixel test passed")
+    return True
+
+
+def test_gs8_hlines():
+    """Test GS8 batched hlines (including clipped lines)"""
+    w, h = 20, 10
+    size = w * h
+    lines = array('h', [0, 0, w, -5, 3, 12, 15, 9, 10, 2, -1, 5, 4, 12, 3])
+
+    if HAS_C_FRAMEBUF:
+        buf_c = bytearray(size)
+        fb_c = framebuf.FrameBuffer(buf_c, w, h, framebuf.GS8)
+        for i in range(0, len(lines), 3):
+            fb_c.hline(lines[i], lines[i + 1], lines[i + 2], 77)
+
+    buf_py = bytearray(size)
+    fb_py = framebuf_pure.FrameBuffer(buf_py, w, h, framebuf_pure.GS8)
+    fb_py.hlines(lines, 77)
+
+    if HAS_C_FRAMEBUF and not compare_buffers(buf_c, buf_py, "GS8 hlines"):
+        return False
+
+    print("✓ GS8 hlines test passed")
+    return True
+
+
+def test_gs8_fill_rects():
+    """Test GS8 batched fill_rects (including clipped rects)"""
+    w, h = 20, 10
+    size = w * h
+    rects = array('h', [1, 1, 5, 3, -3, 6, 8, 8, 15, -2, 10, 5, 7, 7, 0, 4, 30, 0, 2, 2])
+
+    if HAS_C_FRAMEBUF:
+        buf_c = bytearray(size)
+        fb_c = framebuf.FrameBuffer(buf_c, w, h, framebuf.GS8)
+        for i in range(0, len(rects), 4):
+            fb_c.fill_rect(rects[i], rects[i + 1], rects[i + 2], rects[i + 3], 33)
+
+    buf_py = bytearray(size)
+    fb_py = framebuf_pure.FrameBuffer(buf_py, w, h, framebuf_pure.GS8)
+    fb_py.fill_rects(rects, 33)
+
+    if HAS_C_FRAMEBUF and not compare_buffers(buf_c, buf_py, "GS8 fill_rects"):
+        return False
+
+    print("✓ GS8 fill_rects test passed")
+    return True
+
+
 # ========================================================================
 # MONO_HLSB Tests
 # ========================================================================
@@ -712,6 +1050,164 @@ def test_mono_hlsb_fill():
     return True
 
 
+def test_mono_hlsb_fill_rect():
+    """Test MONO_HLSB partial fill_rect: edges, aligned spans, columns, bands, clipping"""
+    w, h = 83, 12
+    size = ((w + 7) // 8) * h
+    colors = [1, 0]
+    test_cases = [
+        (3, 1, 9, 4),            # odd x, odd w (partial head and tail)
+        (9, 2, 3, 3),            # a few pixels in the middle
+        (8, 4, 2, 2),            # within one byte column
+        (8, 3, 16, 2),           # byte-aligned span
+        (1, 1, w - 2, h - 2),    # long rows
+        (5, 0, 2, h),            # tall narrow, odd x
+        (6, 0, 3, h),            # tall narrow, even x
+        (0, 4, w, 3),            # full-width band
+        (-3, -2, 7, 5),          # clipped at negative x/y
+        (w - 5, h - 2, 10, 10),  # clipped at right/bottom
+    ]
+
+    # Non-zero background so masked writes must keep neighbouring pixels
+    init = bytes((i * 37 + 11) & 0xFF for i in range(size))
+
+    if HAS_C_FRAMEBUF:
+        buf_c = bytearray(init)
+        fb_c = framebuf.FrameBuffer(buf_c, w, h, framebuf.MONO_HLSB)
+
+    buf_py = bytearray(init)
+    fb_py = framebuf_pure.FrameBuffer(buf_py, w, h, framebuf_pure.MONO_HLSB)
+
+    for i, (x, y, rw, rh) in enumerate(test_cases):
+        c = colors[i % len(colors)]
+        if HAS_C_FRAMEBUF:
+            fb_c.fill_rect(x, y, rw, rh, c)
+        fb_py.fill_rect(x, y, rw, rh, c)
+        if HAS_C_FRAMEBUF and not compare_buffers(buf_c, buf_py, f"MONO_HLSB fill_rect({x}, {y}, {rw}, {rh}, {c})"):
+            return False
+
+    print("✓ MONO_HLSB fill_rect test passed")
+    return True
+
+
+def test_mono_hlsb_get_set_pixel():
+    """Test MONO_HLSB get_pixel/set_pixel against C pixel()"""
+    w, h = 13, 5
+    size = ((w + 7) // 8) * h
+    test_cases = [(0, 0, 1), (7, 0, 0), (8, 1, 1), (12, 4, 1), (5, 3, 0), (6, 2, 2), (-1, 2, 1), (2, 5, 1)]
+
+    # Non-zero background so set_pixel must keep neighbouring pixels
+    init = bytes((i * 37 + 11) & 0xFF for i in range(size))
+
+    if HAS_C_FRAMEBUF:
+        buf_c = bytearray(init)
+        fb_c = framebuf.FrameBuffer(buf_c, w, h, framebuf.MONO_HLSB)
+
+    buf_py = bytearray(init)
+    fb_py = framebuf_pure.FrameBuffer(buf_py, w, h, framebuf_pure.MONO_HLSB)
+
+    for x, y, c in test_cases:
+        if HAS_C_FRAMEBUF:
+            fb_c.pixel(x, y, c)
+        fb_py.set_pixel(x, y, c)
+
+    if HAS_C_FRAMEBUF and not compare_buffers(buf_c, buf_py, "MONO_HLSB set_pixel"):
+        return False
+
+    for y in range(h):
+        for x in range(w):
+            expected = fb_c.pixel(x, y) if HAS_C_FRAMEBUF else fb_py.pixel(x, y)
+            if fb_py.get_pixel(x, y) != expected:
+                print(f"❌ FAILED: MONO_HLSB get_pixel({x}, {y}) returned {fb_py.get_pixel(x, y)}, expected {expected}")
+                return False
+
+    for x, y in [(-1, 0), (0, -1), (w, 0), (0, h)]:
+        if fb_py.get_pixel(x, y) != 0:
+            print(f"❌ FAILED: MONO_HLSB get_pixel({x}, {y}) out of bounds returned {fb_py.get_pixel(x, y)}")
+            return False
+
+    print("✓ MONO_HLSB get_pixel/set_pixel test passed")
+    return True
+
+
+def test_mono_hlsb_hlines():
+    """Test MONO_HLSB batched hlines (sub-byte edges, clipped lines)"""
+    w, h = 21, 10
+    size = ((w + 7) // 8) * h
+    lines = array('h', [0, 0, w, 3, 1, 4, -5, 2, 12, 15, 9, 10, 2, -1, 5, 9, 3, 11])
+
+    if HAS_C_FRAMEBUF:
+        buf_c = bytearray(size)
+        fb_c = framebuf.FrameBuffer(buf_c, w, h, framebuf.MONO_HLSB)
+        for i in range(0, len(lines), 3):
+            fb_c.hline(lines[i], lines[i + 1], lines[i + 2], 1)
+
+    buf_py = bytearray(size)
+    fb_py = framebuf_pure.FrameBuffer(buf_py, w, h, framebuf_pure.MONO_HLSB)
+    fb_py.hlines(lines, 1)
+
+    if HAS_C_FRAMEBUF and not compare_buffers(buf_c, buf_py, "MONO_HLSB hlines"):
+        return False
+
+    print("✓ MONO_HLSB hlines test passed")
+    return True
+
+
+def test_mono_hlsb_fill_rects():
+    """Test MONO_HLSB batched fill_rects (sub-byte edges, clipped rects)"""
+    w, h = 21, 10
+    size = ((w + 7) // 8) * h
+    rects = array('h', [1, 1, 5, 3, -3, 6, 8, 8, 15, -2, 10, 5, 7, 7, 0, 4, 30, 0, 2, 2, 8, 2, 8, 3])
+
+    if HAS_C_FRAMEBUF:
+        buf_c = bytearray(size)
+        fb_c = framebuf.FrameBuffer(buf_c, w, h, framebuf.MONO_HLSB)
+        fb_c.fill(1)
+        for i in range(0, len(rects), 4):
+            fb_c.fill_rect(rects[i], rects[i + 1], rects[i + 2], rects[i + 3], 0)
+
+    buf_py = bytearray(size)
+    fb_py = framebuf_pure.FrameBuffer(buf_py, w, h, framebuf_pure.MONO_HLSB)
+    fb_py.fill(1)
+    fb_py.fill_rects(rects, 0)
+
+    if HAS_C_FRAMEBUF and not compare_buffers(buf_c, buf_py, "MONO_HLSB fill_rects"):
+        return False
+
+    print("✓ MONO_HLSB fill_rects test passed")
+    return True
+
+
+def test_mono_hlsb_rect():
+    """Test MONO_HLSB rect outlines: degenerate, thin, normal and off-screen"""
+    w, h = 21, 12
+    size = ((w + 7) // 8) * h
+    test_cases = [
+        (3, 3, 0, 5), (3, 3, 5, 0), (3, 3, -2, 4), (2, 2, 4, -3),  # w or h <= 0
+        (1, 1, 1, 6), (2, 3, 7, 2), (4, 4, 2, 2), (5, 1, 2, 9),     # 1 or 2 wide
+        (2, 1, 9, 6), (0, 0, w, h),                                 # normal outline
+        (-3, -2, 8, 6), (w - 4, h - 3, 10, 10), (-2, 3, w + 4, 2),  # partly off-screen
+        (w + 2, 1, 4, 4), (-10, -10, 5, 5), (1, h, 4, 4),           # fully off-screen
+    ]
+
+    if HAS_C_FRAMEBUF:
+        buf_c = bytearray(size)
+        fb_c = framebuf.FrameBuffer(buf_c, w, h, framebuf.MONO_HLSB)
+
+    buf_py = bytearray(size)
+    fb_py = framebuf_pure.FrameBuffer(buf_py, w, h, framebuf_pure.MONO_HLSB)
+
+    for x, y, rw, rh in test_cases:
+        if HAS_C_FRAMEBUF:
+            fb_c.rect(x, y, rw, rh, 1)
+        fb_py.rect(x, y, rw, rh, 1)
+        if HAS_C_FRAMEBUF and not compare_buffers(buf_c, buf_py, f"MONO_HLSB rect({x}, {y}, {rw}, {rh})"):
+            return False
+
+    print("✓ MONO_HLSB rect test passed")
+    return True
+
+
 # ========================================================================
 # MONO_HMSB Tests
 # ========================================================================
@@ -826,6 +1322,86 @@ def test_mono_hmsb_fill():
     return True
 
 
+def test_mono_hmsb_fill_rect():
+    """Test MONO_HMSB partial fill_rect: edges, aligned spans, columns, bands, clipping"""
+    w, h = 83, 12
+    size = ((w + 7) // 8) * h
+    colors = [1, 0]
+    test_cases = [
+        (3, 1, 9, 4),            # odd x, odd w (partial head and tail)
+        (9, 2, 3, 3),            # a few pixels in the middle
+        (8, 4, 2, 2),            # within one byte column
+        (8, 3, 16, 2),           # byte-aligned span
+        (1, 1, w - 2, h - 2),    # long rows
+        (5, 0, 2, h),            # tall narrow, odd x
+        (6, 0, 3, h),            # tall narrow, even x
+        (0, 4, w, 3),            # full-width band
+        (-3, -2, 7, 5),          # clipped at negative x/y
+        (w - 5, h - 2, 10, 10),  # clipped at right/bottom
+    ]
+
+    # Non-zero background so masked writes must keep neighbouring pixels
+    init = bytes((i * 37 + 11) & 0xFF for i in range(size))
+
+    if HAS_C_FRAMEBUF:
+        buf_c = bytearray(init)
+        fb_c = framebuf.FrameBuffer(buf_c, w, h, framebuf.MONO_HMSB)
+
+    buf_py = bytearray(init)
+    fb_py = framebuf_pure.FrameBuffer(buf_py, w, h, framebuf_pure.MONO_HMSB)
+
+    for i, (x, y, rw, rh) in enumerate(test_cases):
+        c = colors[i % len(colors)]
+        if HAS_C_FRAMEBUF:
+            fb_c.fill_rect(x, y, rw, rh, c)
+        fb_py.fill_rect(x, y, rw, rh, c)
+        if HAS_C_FRAMEBUF and not compare_buffers(buf_c, buf_py, f"MONO_HMSB fill_rect({x}, {y}, {rw}, {rh}, {c})"):
+            return False
+
+    print("✓ MONO_HMSB fill_rect test passed")
+    return True
+
+
+def test_mono_hmsb_get_set_pixel():
+    """Test MONO_HMSB get_pixel/set_pixel against C pixel()"""
+    w, h = 13, 5
+    size = ((w + 7) // 8) * h
+    test_cases = [(0, 0, 1), (7, 0, 0), (8, 1, 1), (12, 4, 1), (5, 3, 0), (6, 2, 2), (-1, 2, 1), (2, 5, 1)]
+
+    # Non-zero background so set_pixel must keep neighbouring pixels
+    init = bytes((i * 37 + 11) & 0xFF for i in range(size))
+
+    if HAS_C_FRAMEBUF:
+        buf_c = bytearray(init)
+        fb_c = framebuf.FrameBuffer(buf_c, w, h, framebuf.MONO_HMSB)
+
+    buf_py = bytearray(init)
+    fb_py = framebuf_pure.FrameBuffer(buf_py, w, h, framebuf_pure.MONO_HMSB)
+
+    for x, y, c in test_cases:
+        if HAS_C_FRAMEBUF:
+            fb_c.pixel(x, y, c)
+        fb_py.set_pixel(x, y, c)
+
+    if HAS_C_FRAMEBUF and not compare_buffers(buf_c, buf_py, "MONO_HMSB set_pixel"):
+        return False
+
+    for y in range(h):
+        for x in range(w):
+            expected = fb_c.pixel(x, y) if HAS_C_FRAMEBUF else fb_py.pixel(x, y)
+            if fb_py.get_pixel(x, y) != expected:
+                print(f"❌ FAILED: MONO_HMSB get_pixel({x}, {y}) returned {fb_py.get_pixel(x, y)}, expected {expected}")
+                return False
+
+    for x, y in [(-1, 0), (0, -1), (w, 0), (0, h)]:
+        if fb_py.get_pixel(x, y) != 0:
+            print(f"❌ FAILED: MONO_HMSB get_pixel({x}, {y}) out of bounds returned {fb_py.get_pixel(x, y)}")
+            return False
+
+    print("✓ MONO_HMSB get_pixel/set_pixel test passed")
+    return True
+
+
 # ========================================================================
 # GS4_HMSB Tests
 # ========================================================================
@@ -948,6 +1524,86 @@ def test_gs4_hmsb_fill():
     return True
 
 
+def test_gs4_hmsb_fill_rect():
+    """Test GS4_HMSB partial fill_rect: edges, aligned spans, columns, bands, clipping"""
+    w, h = 41, 12
+    size = ((w + 1) // 2) * h
+    colors = [0x5, 0xA, 0]
+    test_cases = [
+        (3, 1, 9, 4),            # odd x, odd w (partial head and tail)
+        (9, 2, 3, 3),            # a few pixels in the middle
+        (8, 4, 2, 2),            # within one byte column
+        (8, 3, 16, 2),           # byte-aligned span
+        (1, 1, w - 2, h - 2),    # long rows
+        (5, 0, 2, h),            # tall narrow, odd x
+        (6, 0, 3, h),            # tall narrow, even x
+        (0, 4, w, 3),            # full-width band
+        (-3, -2, 7, 5),          # clipped at negative x/y
+        (w - 5, h - 2, 10, 10),  # clipped at right/bottom
+    ]
+
+    # Non-zero background so masked writes must keep neighbouring pixels
+    init = bytes((i * 37 + 11) & 0xFF for i in range(size))
+
+    if HAS_C_FRAMEBUF:
+        buf_c = bytearray(init)
+        fb_c = framebuf.FrameBuffer(buf_c, w, h, framebuf.GS4_HMSB)
+
+    buf_py = bytearray(init)
+    fb_py = framebuf_pure.FrameBuffer(buf_py, w, h, framebuf_pure.GS4_HMSB)
+
+    for i, (x, y, rw, rh) in enumerate(test_cases):
+        c = colors[i % len(colors)]
+        if HAS_C_FRAMEBUF:
+            fb_c.fill_rect(x, y, rw, rh, c)
+        fb_py.fill_rect(x, y, rw, rh, c)
+        if HAS_C_FRAMEBUF and not compare_buffers(buf_c, buf_py, f"GS4_HMSB fill_rect({x}, {y}, {rw}, {rh}, {c})"):
+            return False
+
+    print("✓ GS4_HMSB fill_rect test passed")
+    return True
+
+
+def test_gs4_hmsb_get_set_pixel():
+    """Test GS4_HMSB get_pixel/set_pixel against C pixel()"""
+    w, h = 7, 5
+    size = ((w + 1) // 2) * h
+    test_cases = [(0, 0, 0xF), (1, 0, 0x3), (2, 1, 0xA), (3, 1, 0x5), (6, 4, 0x9), (5, 4, 0x1C), (4, 2, 0), (-1, 2, 7), (2, 5, 7)]
+
+    # Non-zero background so set_pixel must keep neighbouring pixels
+    init = bytes((i * 37 + 11) & 0xFF for i in range(size))
+
+    if HAS_C_FRAMEBUF:
+        buf_c = bytearray(init)
+        fb_c = framebuf.FrameBuffer(buf_c, w, h, framebuf.GS4_HMSB)
+
+    buf_py = bytearray(init)
+    fb_py = framebuf_pure.FrameBuffer(buf_py, w, h, framebuf_pure.GS4_HMSB)
+
+    for x, y, c in test_cases:
+        if HAS_C_FRAMEBUF:
+            fb_c.pixel(x, y, c)
+        fb_py.set_pixel(x, y, c)
+
+    if HAS_C_FRAMEBUF and not compare_buffers(buf_c, buf_py, "GS4_HMSB set_pixel"):
+        return False
+
+    for y in range(h):
+        for x in range(w):
+            expected = fb_c.pixel(x, y) if HAS_C_FRAMEBUF else fb_py.pixel(x, y)
+            if fb_py.get_pixel(x, y) != expected:
+                print(f"❌ FAILED: GS4_HMSB get_pixel({x}, {y}) returned {fb_py.get_pixel(x, y)}, expected {expected}")
+                return False
+
+    for x, y in [(-1, 0), (0, -1), (w, 0), (0, h)]:
+        if fb_py.get_pixel(x, y) != 0:
+            print(f"❌ FAILED: GS4_HMSB get_pixel({x}, {y}) out of bounds returned {fb_py.get_pixel(x, y)}")
+            return False
+
+    print("✓ GS4_HMSB get_pixel/set_pixel test passed")
+    return True
+
+
 # ========================================================================
 # GS2_HMSB Tests
 # ========================================================================
@@ -1061,6 +1717,221 @@ def test_gs2_hmsb_fill():
     return True
 
 
+def test_gs2_hmsb_fill_rect():
+    """Test GS2_HMSB partial fill_rect: edges, aligned spans, columns, bands, clipping"""
+    w, h = 45, 12
+    size = ((w + 3) // 4) * h
+    colors = [1, 2, 3, 0]
+    test_cases = [
+        (3, 1, 9, 4),            # odd x, odd w (partial head and tail)
+        (9, 2, 3, 3),            # a few pixels in the middle
+        (8, 4, 2, 2),            # within one byte column
+        (8, 3, 16, 2),           # byte-aligned span
+        (1, 1, w - 2, h - 2),    # long rows
+        (5, 0, 2, h),            # tall narrow, odd x
+        (6, 0, 3, h),            # tall narrow, even x
+        (0, 4, w, 3),            # full-width band
+        (-3, -2, 7, 5),          # clipped at negative x/y
+        (w - 5, h - 2, 10, 10),  # clipped at right/bottom
+    ]
+
+    # Non-zero background so masked writes must keep neighbouring pixels
+    init = bytes((i * 37 + 11) & 0xFF for i in range(size))
+
+    if HAS_C_FRAMEBUF:
+        buf_c = bytearray(init)
+        fb_c = framebuf.FrameBuffer(buf_c, w, h, framebuf.GS2_HMSB)
+
+    buf_py = bytearray(init)
+    fb_py = framebuf_pure.FrameBuffer(buf_py, w, h, framebuf_pure.GS2_HMSB)
+
+    for i, (x, y, rw, rh) in enumerate(test_cases):
+        c = colors[i % len(colors)]
+        if HAS_C_FRAMEBUF:
+            fb_c.fill_rect(x, y, rw, rh, c)
+        fb_py.fill_rect(x, y, rw, rh, c)
+        if HAS_C_FRAMEBUF and not compare_buffers(buf_c, buf_py, f"GS2_HMSB fill_rect({x}, {y}, {rw}, {rh}, {c})"):
+            return False
+
+    print("✓ GS2_HMSB fill_rect test passed")
+    return True
+
+
+def test_gs2_hmsb_get_set_pixel():
+    """Test GS2_HMSB get_pixel/set_pixel against C pixel()"""
+    w, h = 7, 5
+    size = ((w + 3) // 4) * h
+    test_cases = [(0, 0, 3), (1, 0, 1), (2, 0, 2), (3, 0, 0), (4, 1, 3), (6, 4, 2), (5, 3, 7), (-1, 2, 1), (2, 5, 1)]
+
+    # Non-zero background so set_pixel must keep neighbouring pixels
+    init = bytes((i * 37 + 11) & 0xFF for i in range(size))
+
+    if HAS_C_FRAMEBUF:
+        buf_c = bytearray(init)
+        fb_c = framebuf.FrameBuffer(buf_c, w, h, framebuf.GS2_HMSB)
+
+    buf_py = bytearray(init)
+    fb_py = framebuf_pure.FrameBuffer(buf_py, w, h, framebuf_pure.GS2_HMSB)
+
+    for x, y, c in test_cases:
+        if HAS_C_FRAMEBUF:
+            fb_c.pixel(x, y, c)
+        fb_py.set_pixel(x, y, c)
+
+    if HAS_C_FRAMEBUF and not compare_buffers(buf_c, buf_py, "GS2_HMSB set_pixel"):
+        return False
+
+    for y in range(h):
+        for x in range(w):
+            expected = fb_c.pixel(x, y) if HAS_C_FRAMEBUF else fb_py.pixel(x, y)
+            if fb_py.get_pixel(x, y) != expected:
+                print(f"❌ FAILED: GS2_HMSB get_pixel({x}, {y}) returned {fb_py.get_pixel(x, y)}, expected {expected}")
+                return False
+
+    for x, y in [(-1, 0), (0, -1), (w, 0), (0, h)]:
+        if fb_py.get_pixel(x, y) != 0:
+            print(f"❌ FAILED: GS2_HMSB get_pixel({x}, {y}) out of bounds returned {fb_py.get_pixel(x, y)}")
+            return False
+
+    print("✓ GS2_HMSB get_pixel/set_pixel test passed")
+    return True
+
+
+# ========================================================================
+# Layout Tests (stride rounding, buffer size, padding)
+# ========================================================================
+
+def buffer_size(fmt, w, h, stride):
+    """Buffer size the C module requires for a format, as in its constructor"""
+    if fmt in (framebuf_pure.MONO_HLSB, framebuf_pure.MONO_HMSB):
+        stride = (stride + 7) & ~7
+    elif fmt == framebuf_pure.GS2_HMSB:
+        stride = (stride + 3) & ~3
+    elif fmt == framebuf_pure.GS4_HMSB:
+        stride = (stride + 1) & ~1
+    if fmt == framebuf_pure.MONO_VLSB:
+        h = (h + 7) & ~7
+    bpp = {framebuf_pure.MONO_VLSB: 1, framebuf_pure.RGB565: 16, framebuf_pure.GS4_HMSB: 4,
+           framebuf_pure.MONO_HLSB: 1, framebuf_pure.MONO_HMSB: 1, framebuf_pure.GS2_HMSB: 2,
+           framebuf_pure.GS8: 8}[fmt]
+    return h * stride * bpp // 8
+
+
+FORMAT_NAMES = ["MONO_VLSB", "RGB565", "GS4_HMSB", "MONO_HLSB", "MONO_HMSB", "GS2_HMSB", "GS8"]
+
+
+def test_stride_rounding():
+    """Test stride rounding to whole bytes per row for odd widths"""
+    # (format, width, stride, expected rounded stride)
+    test_cases = [
+        (framebuf_pure.GS4_HMSB, 7, None, 8),
+        (framebuf_pure.GS4_HMSB, 7, 9, 10),
+        (framebuf_pure.GS2_HMSB, 5, None, 8),
+        (framebuf_pure.GS2_HMSB, 7, 9, 12),
+        (framebuf_pure.MONO_HLSB, 13, None, 16),
+        (framebuf_pure.MONO_HMSB, 13, 17, 24),
+    ]
+    h = 5
+
+    for fmt, w, stride, expected in test_cases:
+        name = FORMAT_NAMES[fmt]
+        size = buffer_size(fmt, w, h, w if stride is None else stride)
+
+        buf_py = bytearray(size)
+        fb_py = framebuf_pure.FrameBuffer(buf_py, w, h, fmt, stride)
+        if fb_py.stride != expected:
+            print(f"❌ FAILED: {name} width {w} stride {stride} rounded to {fb_py.stride}, expected {expected}")
+            return False
+
+        # Every primitive must address the same (rounded) rows as C
+        if HAS_C_FRAMEBUF:
+            buf_c = bytearray(size)
+            fb_c = framebuf.FrameBuffer(buf_c, w, h, fmt, stride)
+            fb_c.pixel(w - 1, h - 1, 1)
+            fb_c.hline(1, 2, w, 1)
+            fb_c.vline(w - 2, 0, h, 1)
+            fb_c.fill_rect(0, 3, 3, 2, 1)
+        fb_py.pixel(w - 1, h - 1, 1)
+        fb_py.hline(1, 2, w, 1)
+        fb_py.vline(w - 2, 0, h, 1)
+        fb_py.fill_rect(0, 3, 3, 2, 1)
+
+        if HAS_C_FRAMEBUF and not compare_buffers(buf_c, buf_py, f"{name} width {w} stride {stride}"):
+            return False
+
+    print("✓ Stride rounding test passed")
+    return True
+
+
+def test_buffer_too_small():
+    """Test ValueError for a buffer one byte short of the required size"""
+    w, h = 13, 10
+
+    for fmt in range(len(FORMAT_NAMES)):
+        size = buffer_size(fmt, w, h, w)
+        framebuf_pure.FrameBuffer(bytearray(size), w, h, fmt)
+        try:
+            framebuf_pure.FrameBuffer(bytearray(size - 1), w, h, fmt)
+        except ValueError as e:
+            if str(e) != "buffer too small":
+                print(f"❌ FAILED: {FORMAT_NAMES[fmt]} raised ValueError({e!r})")
+                return False
+        else:
+            print(f"❌ FAILED: {FORMAT_NAMES[fmt]} accepted a {size - 1} byte buffer")
+            return False
+
+    print("✓ Buffer too small test passed")
+    return True
+
+
+def test_fill_padding():
+    """Test fill() with stride > width leaves padding as C does"""
+    w, h = 13, 11  # h not a multiple of 8 - MONO_VLSB has unused rows
+    stride = w + 5
+
+    for fmt in range(len(FORMAT_NAMES)):
+        name = FORMAT_NAMES[fmt]
+        size = buffer_size(fmt, w, h, stride)
+        # Non-zero background so overwritten padding shows up
+        init = bytes((i * 37 + 11) & 0xFF for i in range(size))
+
+        if HAS_C_FRAMEBUF:
+            buf_c = bytearray(init)
+            fb_c = framebuf.FrameBuffer(buf_c, w, h, fmt, stride)
+
+        buf_py = bytearray(init)
+        fb_py = framebuf_pure.FrameBuffer(buf_py, w, h, fmt, stride)
+
+        for c in (0xFFFF, 0):
+            if HAS_C_FRAMEBUF:
+                fb_c.fill(c)
+            fb_py.fill(c)
+            if HAS_C_FRAMEBUF and not compare_buffers(buf_c, buf_py, f"{name} fill({c}) stride {stride}"):
+                return False
+
+    print("✓ Fill padding test passed")
+    return True
+
+
+def test_invalid_format():
+    """Test ValueError("invalid format") for out-of-range formats"""
+    buf = bytearray(64)
+
+    for fmt in (7, -1):
+        try:
+            framebuf_pure.FrameBuffer(buf, 8, 8, fmt)
+        except ValueError as e:
+            if str(e) != "invalid format":
+                print(f"❌ FAILED: format {fmt} raised ValueError({e!r})")
+                return False
+        else:
+            print(f"❌ FAILED: format {fmt} was accepted")
+            return False
+
+    print("✓ Invalid format test passed")
+    return True
+
+
 # ========================================================================
 # Test Runner
 # ========================================================================
@@ -1077,8 +1948,11 @@ def run_mono_vlsb_tests():
         test_mono_vlsb_hline,
         test_mono_vlsb_vline,
         test_mono_vlsb_fill,
+        test_mono_vlsb_fill_rect,
+        test_mono_vlsb_get_set_pixel,
         test_mono_vlsb_edge_cases,
         test_mono_vlsb_realistic_size,
+        test_mono_vlsb_rect,
     ]
 
     passed = 0
@@ -1114,6 +1988,9 @@ def run_rgb565_tests():
         test_rgb565_hline,
         test_rgb565_vline,
         test_rgb565_fill,
+        test_rgb565_fill_rect,
+        test_rgb565_get_set_pixel,
+        test_rgb565_rect,
     ]
 
     passed = 0
@@ -1149,6 +2026,10 @@ def run_gs8_tests():
         test_gs8_hline,
         test_gs8_vline,
         test_gs8_fill,
+        test_gs8_fill_rect,
+        test_gs8_get_set_pixel,
+        test_gs8_hlines,
+        test_gs8_fill_rects,
     ]
 
     passed = 0
@@ -1184,6 +2065,11 @@ def run_mono_hlsb_tests():
         test_mono_hlsb_hline,
         test_mono_hlsb_vline,
         test_mono_hlsb_fill,
+        test_mono_hlsb_fill_rect,
+        test_mono_hlsb_get_set_pixel,
+        test_mono_hlsb_hlines,
+        test_mono_hlsb_fill_rects,
+        test_mono_hlsb_rect,
     ]
 
     passed = 0
@@ -1219,6 +2105,8 @@ def run_mono_hmsb_tests():
         test_mono_hmsb_hline,
         test_mono_hmsb_vline,
         test_mono_hmsb_fill,
+        test_mono_hmsb_fill_rect,
+        test_mono_hmsb_get_set_pixel,
     ]
 
     passed = 0
@@ -1254,6 +2142,8 @@ def run_gs4_hmsb_tests():
         test_gs4_hmsb_hline,
         test_gs4_hmsb_vline,
         test_gs4_hmsb_fill,
+        test_gs4_hmsb_fill_rect,
+        test_gs4_hmsb_get_set_pixel,
     ]
 
     passed = 0
@@ -1289,6 +2179,43 @@ def run_gs2_hmsb_tests():
         test_gs2_hmsb_hline,
         test_gs2_hmsb_vline,
         test_gs2_hmsb_fill,
+        test_gs2_hmsb_fill_rect,
+        test_gs2_hmsb_get_set_pixel,
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test in tests:
+        try:
+            if test():
+                passed += 1
+            else:
+                failed += 1
+        except Exception as e:
+            print(f"❌ EXCEPTION in {test.__name__}: {e}")
+            import sys
+            sys.print_exception(e)
+            failed += 1
+
+    print("\n" + "="*60)
+    print(f"Results: {passed} passed, {failed} failed")
+    print("="*60)
+
+    return failed == 0
+
+
+def run_layout_tests():
+    """Run all layout tests"""
+    print("\n" + "="*60)
+    print("Testing Layout (stride, buffer size, padding)")
+    print("="*60)
+
+    tests = [
+        test_stride_rounding,
+        test_buffer_too_small,
+        test_fill_padding,
+        test_invalid_format,
     ]
 
     passed = 0
@@ -1342,6 +2269,10 @@ def run_all():
     if not run_gs2_hmsb_tests():
         success = False
 
+    # Phase 5: layout shared by all formats
+    if not run_layout_tests():
+        success = False
+
     if success:
         print("\n✅ ALL TESTS PASSED!")
     else: